@@ -1,28 +1,85 @@
 #!/usr/bin/env python3
 
+import itertools
+import operator
+import os
+import sys
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
+
+def count_increases(v, window=1):
+    '''Count how many times the sum of a window of depths is larger than the
+    sum of the window one position earlier. The two windows share all but
+    their end points, so this is just how many times v[i] > v[i - window].
+
+    A NumPy array is compared all at once. Anything else may be any iterable,
+    which is read in one pass, keeping only the last window values.'''
+    assert window >= 1
+    if numeric.is_array(v):
+        np = numeric.numpy()
+        return int(np.count_nonzero(v[window:] > v[:-window]))
+
+    earlier, later = itertools.tee(v)
+    later = itertools.islice(later, window, None)
+    return sum(map(operator.lt, earlier, later))
+
 def part1(v):
-    increases = 0
-    for i in range(1, len(v)):
-        if v[i-1] < v[i]:
-            increases += 1
-    return increases
+    return count_increases(v, 1)
 
 def part2(v):
-    increases = 0
-    s = v[0] + v[1] + v[2]
-    for i in range(3, len(v)):
-        s2 = s - v[i - 3] + v[i]
-        if s < s2:
-            increases += 1
-        s = s2
-    return increases
+    return count_increases(v, 3)
 
-def main():
-    with open('1.in') as f:
-        v = list(map(int, f))
+# For files bigger than memory, --parallel counts the increases of chunks of the
+# file in a pool of processes (see aoc.parallel).
 
-    print('part 1:', part1(v))
-    print('part 2:', part2(v))
+def count_chunk(data, windows):
+    '''Count the increases for each window within data (a chunk of the file).
+    Return (counts, first values, last values), where the first and last
+    max(windows) values are for fixing up the windows that span chunks.'''
+    v = numeric.parse_ints(data)
+    k = max(windows)
+    counts = [count_increases(v, w) for w in windows]
+    return counts, list(map(int, v[:k])), list(map(int, v[-k:]))
+
+def count_increases_parallel(file, windows, workers=None, chunk_bytes=None):
+    '''Count the increases of the depths in the file for each of the windows,
+    the same as count_increases(), by splitting the file into chunks (on line
+    boundaries) that are counted in parallel.'''
+    # imported here, since only --parallel needs it
+    from aoc import parallel
+    chunks = parallel.map_lines(count_chunk, file, windows, workers=workers,
+                                chunk_bytes=chunk_bytes)
+
+    totals = [0] * len(windows)
+    # the last values of everything before the current chunk
+    previous = []
+    for counts, first, last in chunks:
+        for n, w in enumerate(windows):
+            # pairs (v[i - w], v[i]) with v[i - w] in an earlier chunk and
+            # v[i] in this one
+            before = previous[-w:]
+            spanning = before + first[:w]
+            span = range(min(len(before), len(spanning) - w))
+            totals[n] += counts[n] + sum(spanning[j] < spanning[j + w] for j in span)
+        previous = (previous + last)[-max(windows):]
+    return totals
+
+def stream_input(f):
+    return map(int, f)
+
+def read_input(file):
+    return numeric.load_ints(file)
+
+def main():
+    file = aoc.input_file(__file__)
+    if '--parallel' in sys.argv:
+        for n, answer in enumerate(count_increases_parallel(file, (1, 3)), 1):
+            print(f'part {n}:', answer)
+        return
+    aoc.run(__file__, file, read_input, part1, part2, stream=stream_input)
 
 if __name__ == '__main__':
     main()
@@ -1,37 +1,151 @@
 #!/usr/bin/env python3
 
-def part1(cmds):
-    x = y = 0
-    for c, d in cmds:
-        if c == 'forward':
-            x += d
-        elif c == 'down':
-            y += d
-        elif c == 'up':
-            y -= d
+import functools
+import math
+import os
+import sys
 
-    return x * y
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
 
-def part2(cmds):
+FORWARD, DOWN, UP = 0, 1, 2
+
+# the commands are told apart by their first letter
+OPCODES = {ord('f'): FORWARD, ord('d'): DOWN, ord('u'): UP}
+
+# Each command changes (x, y, aim) by an affine transform, and so does any
+# sequence of commands. A sequence is summarized by (dx, dy, daim): starting from
+# (x, y, aim) it ends at (x + dx, y + dy + aim * dx, aim + daim). In part 1, the
+# depth is just what part 2 calls the aim.
+
+def summarize(cmds):
+    '''Summarize a sequence of (opcode, amount) commands.'''
     aim = x = y = 0
     for c, d in cmds:
-        if c == 'forward':
+        if c == FORWARD:
             y += aim * d
             x += d
-        elif c == 'down':
+        elif c == DOWN:
             aim += d
-        elif c == 'up':
+        else:
             aim -= d
+    return x, y, aim
+
+def combine(a, b):
+    '''The summary of the commands of a followed by those of b. This is
+    associative, so summaries of chunks can be combined in any grouping.'''
+    ax, ay, aaim = a
+    bx, by, baim = b
+    return ax + bx, ay + by + aaim * bx, aaim + baim
+
+IDENTITY = (0, 0, 0)
+
+def summarize_arrays(ops, amounts):
+    '''Summarize commands given as NumPy arrays of opcodes and amounts, a block
+    at a time. In a block of n commands whose amounts are at most m, the aim
+    is at most n * m and the sum of aim * amount at most (n * m) ** 2, so the
+    blocks are made small enough for that to fit in an int64. If that would
+    make them too small to be worthwhile, the sums are done with Python ints
+    (dtype object) instead.'''
+    np = numeric.numpy()
+
+    largest = max(1, int(np.abs(amounts).max())) if len(amounts) else 1
+    block = min(1 << 20, math.isqrt((1 << 63) - 1) // largest)
+    if block < 1 << 10:
+        amounts = amounts.astype(object)
+        block = max(1, len(amounts))
+
+    summary = IDENTITY
+    for low in range(0, len(ops), block):
+        op, d = ops[low:low + block], amounts[low:low + block]
+        forward = op == FORWARD
+        aim = np.cumsum(np.where(op == DOWN, d, 0) - np.where(op == UP, d, 0))
+        s = (int(d[forward].sum()), int((aim[forward] * d[forward]).sum()),
+             int(aim[-1]) if len(aim) else 0)
+        summary = combine(summary, s)
+    return summary
+
+class Commands:
+    '''Commands parsed in bulk, as parallel arrays of opcodes and amounts.'''
 
+    def __init__(self, ops, amounts):
+        self.ops = ops
+        self.amounts = amounts
+
+    def __iter__(self):
+        return zip(self.ops, self.amounts)
+
+    def summary(self):
+        if numeric.is_array(self.ops):
+            return summarize_arrays(self.ops, self.amounts)
+        return summarize(self)
+
+def parse_commands(data):
+    '''Parse the commands in data (bytes, or e.g. an mmap) into Commands. The
+    opcode of a command is taken from the first letter of its line, and its
+    amount is the only number on the line.'''
+    amounts = numeric.parse_ints(data)
+    if numeric.is_array(amounts):
+        np = numeric.numpy()
+        buf = np.frombuffer(data, dtype=np.uint8) if len(data) else np.zeros(0, np.uint8)
+        starts = np.flatnonzero(buf[:-1] == ord('\n')) + 1
+        if len(buf) and buf[0] != ord('\n'):
+            starts = np.concatenate(([0], starts))
+        firsts = buf[starts]
+        del buf
+        table = np.full(256, -1, dtype=np.int8)
+        for letter, op in OPCODES.items():
+            table[letter] = op
+        ops = table[firsts[firsts != ord('\n')]]
+    else:
+        from array import array
+        ops = array('b', (OPCODES[line[0]] for line in bytes(data).split(b'\n') if line))
+    assert len(ops) == len(amounts), (len(ops), len(amounts))
+    return Commands(ops, amounts)
+
+def summary(cmds):
+    return cmds.summary() if isinstance(cmds, Commands) else summarize(cmds)
+
+def part1(cmds):
+    x, _, depth = summary(cmds)
+    return x * depth
+
+def part2(cmds):
+    x, y, _ = summary(cmds)
     return x * y
 
+# For very many commands, --parallel summarizes chunks of the file in a pool of
+# processes (see aoc.parallel), and combines the summaries.
 
-def main():
-    with open('2.in') as f:
-        cmds = [(a, int(b)) for a, b in map(str.split, f)]
+def summarize_chunk(data):
+    '''Summarize the commands in data (a chunk of the file).'''
+    return parse_commands(data).summary()
+
+def summarize_parallel(file, workers=None, chunk_bytes=None):
+    '''The summary of all the commands in the file, computed in parallel.'''
+    # imported here, since only --parallel needs it
+    from aoc import parallel
+    summaries = parallel.map_lines(summarize_chunk, file, workers=workers,
+                                   chunk_bytes=chunk_bytes)
+    return functools.reduce(combine, summaries, IDENTITY)
 
-    print('part 1:', part1(cmds))
-    print('part 2:', part2(cmds))
+def stream_input(f):
+    return ((OPCODES[ord(a[0])], int(b)) for a, b in map(str.split, f))
+
+def read_input(file):
+    with open(file, 'rb') as f:
+        return parse_commands(f.read())
+
+def main():
+    file = aoc.input_file(__file__)
+    if '--parallel' in sys.argv:
+        x, y, aim = summarize_parallel(file)
+        print('part 1:', x * aim)
+        print('part 2:', x * y)
+        return
+    aoc.run(__file__, file, read_input, part1, part2, stream=stream_input)
 
 if __name__ == '__main__':
     main()
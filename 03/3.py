@@ -3,63 +3,203 @@
 # https://adventofcode.com/2021/day/3
 # Author: Greg Hamerly
 
+import bisect
+import os
+import sys
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
+
+# rows whose bits are unpacked at once by Report.column_ones()
+ROWS_PER_BLOCK = 1 << 16
+
+class Report:
+    '''The diagnostic report, parsed once: each row is an integer of the given
+    width in bits (the first character of a row is its most significant bit).
+    The values are a NumPy uint64 array when NumPy is available and the rows
+    are at most 64 bits wide, and a list of ints otherwise.'''
+
+    def __init__(self, values, width):
+        self.values = values
+        self.width = width
+
+    def __len__(self):
+        return len(self.values)
+
+    @staticmethod
+    def parse(data):
+        '''Parse the report from bytes: one row of '0' and '1' per line, all of
+        the same width. Rows of other widths, or lines that end in anything but
+        a single newline, are parsed one by one into a list.'''
+        data = bytes(data).strip() + b'\n'
+        width = data.index(b'\n')
+        np = numeric.numpy()
+        if np is not None and 0 < width <= 64 and len(data) % (width + 1) == 0:
+            # a matrix of the bits, one row per line (plus its newline)
+            bits = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)
+            if (bits[:, width] == ord('\n')).all():
+                # pad the bits on the left to 64, and pack them into words
+                padded = np.zeros((len(bits), 64), dtype=bool)
+                padded[:, 64 - width:] = bits[:, :width] == ord('1')
+                values = np.packbits(padded, axis=1).view('>u8').ravel().astype(np.uint64)
+                return Report(values, width)
+
+        rows = data.split()
+        return Report([int(row, 2) for row in rows], len(rows[0]) if rows else 0)
+
+    def is_numpy(self):
+        return numeric.is_array(self.values)
+
+    def column_ones(self):
+        '''The number of ones in each column, from the most significant.'''
+        if self.is_numpy():
+            np = numeric.numpy()
+            # the bytes of each word, most significant first, unpacked into
+            # 64 bits per row and summed by column (a block of rows at a time,
+            # to keep the unpacked bits small)
+            words = self.values.astype('>u8').view(np.uint8).reshape(-1, 8)
+            ones = np.zeros(64, dtype=np.uint64)
+            for low in range(0, len(words), ROWS_PER_BLOCK):
+                ones += np.unpackbits(words[low:low + ROWS_PER_BLOCK], axis=1).sum(axis=0)
+            return [int(n) for n in ones[64 - self.width:]]
+        return [sum((v >> pos) & 1 for v in self.values) for pos in reversed(range(self.width))]
+
+def column_ones(cmds):
+    '''Return (ones, total): the number of ones in each bit column, and the
+    number of rows. cmds is a Report, or else any iterable of rows (as
+    strings), which is read in one pass.'''
+    if isinstance(cmds, Report):
+        return cmds.column_ones(), len(cmds)
+
+    ones = None
+    total = 0
+    for row in map(str.strip, cmds):
+        if ones is None:
+            ones = [0] * len(row)
+        for pos, bit in enumerate(row):
+            if bit == '1':
+                ones[pos] += 1
+        total += 1
+    return ones or [], total
+
 def part1(cmds):
-    bits = zip(*map(str.strip, cmds))
+    ones, total = column_ones(cmds)
 
     gamma = epsilon = 0
-    for row in bits:
+    for col_ones in ones:
         gamma *= 2
         epsilon *= 2
 
-        zeros = row.count('0')
-        ones = row.count('1')
-        assert zeros != ones
+        zeros = total - col_ones
+        assert zeros != col_ones
 
-        if zeros < ones:
+        if zeros < col_ones:
             gamma += 1
         else:
             epsilon += 1
 
     return gamma * epsilon
 
-def part2_sub(rows, f):
-    remaining = list(range(len(rows)))
-    pos = 0
+def part2_sub(report, f):
+    '''Find a rating by repeatedly filtering the remaining rows, which takes
+    O(n * width) work. RatingIndex (below) is faster, and is what part2
+    uses.'''
+    remaining = report.values
+    pos = report.width - 1
 
-    # keep filtering out the remaining indexes of the given rows until exactly
-    # one is left (the problem is designed to end with exactly one)
+    # keep filtering out the remaining rows until exactly one is left (the
+    # problem is designed to end with exactly one)
     while len(remaining) > 1:
         # look at the bits in the current position
-        bits = [rows[i][pos] for i in remaining]
-        zeros = bits.count('0')
-        ones = bits.count('1')
-        remaining = [i for i in remaining if rows[i][pos] == f(zeros, ones)]
-        pos += 1
+        if report.is_numpy():
+            np = numeric.numpy()
+            bits = (remaining >> np.uint64(pos)) & np.uint64(1)
+            ones = int(np.count_nonzero(bits))
+            keep = f(len(remaining) - ones, ones)
+            remaining = remaining[bits == keep]
+        else:
+            ones = sum((v >> pos) & 1 for v in remaining)
+            keep = f(len(remaining) - ones, ones)
+            remaining = [v for v in remaining if (v >> pos) & 1 == keep]
+        pos -= 1
 
     assert len(remaining) == 1
-
-    # parse this number as base-2
-    return int(rows[remaining[0]], 2)
+    return int(remaining[0])
+
+class RatingIndex:
+    '''The rows of a report, sorted, so that the rows that share a prefix of
+    bits are a contiguous range, in which the rows with a 0 in the next bit
+    come before those with a 1. Counting the zeros and ones in the next bit is
+    then one binary search, so finding a rating takes O(width * log n), with any
+    policy for which bit to keep.'''
+
+    def __init__(self, report):
+        self.width = report.width
+        self.numpy = report.is_numpy()
+        if self.numpy:
+            np = numeric.numpy()
+            self.values = np.sort(report.values)
+        else:
+            self.values = sorted(report.values)
+
+    def first_at_least(self, x, lo, hi):
+        '''The index of the first row in [lo, hi) that is at least x.'''
+        if self.numpy:
+            np = numeric.numpy()
+            return lo + int(np.searchsorted(self.values[lo:hi], np.uint64(x)))
+        return bisect.bisect_left(self.values, x, lo, hi)
+
+    def rating(self, f):
+        '''Keep the rows whose next bit is f(zeros, ones), bit by bit, until
+        one row is left, and return it.'''
+        lo, hi = 0, len(self.values)
+        prefix = 0
+        pos = self.width - 1
+        while hi - lo > 1:
+            assert pos >= 0, 'the rows are not unique'
+            # the rows in [lo, hi) all start with prefix; those from mid on
+            # also have a 1 at pos
+            mid = self.first_at_least(prefix | (1 << pos), lo, hi)
+            keep = f(mid - lo, hi - mid)
+            if keep:
+                lo = mid
+                prefix |= 1 << pos
+            else:
+                hi = mid
+            pos -= 1
+
+        assert hi - lo == 1
+        return int(self.values[lo])
 
 def part2(cmds):
-    rows = list(map(str.strip, cmds))
+    # the filtering needs to revisit the rows, so (unlike part1) this keeps all
+    # of them in memory
+    if not isinstance(cmds, Report):
+        cmds = Report.parse(''.join(cmds).encode())
+
+    index = RatingIndex(cmds)
 
     # keep only the most common bit; use 1 if there's a tie
-    most_common = lambda zeros, ones: '1' if zeros <= ones else '0' 
-    o2 = part2_sub(rows, most_common)
+    most_common = lambda zeros, ones: 1 if zeros <= ones else 0
+    o2 = index.rating(most_common)
 
     # keep only the least common bit; use 0 if there's a tie
-    least_common = lambda zeros, ones: '0' if zeros <= ones else '1' 
-    co2 = part2_sub(rows, least_common)
+    least_common = lambda zeros, ones: 0 if zeros <= ones else 1
+    co2 = index.rating(least_common)
 
     return o2 * co2
 
-def main():
-    with open('3.in') as f:
-        cmds = list(f)
+def stream_input(f):
+    return f
 
-    print('part 1:', part1(cmds))
-    print('part 2:', part2(cmds))
+def read_input(file):
+    with open(file, 'rb') as f:
+        return Report.parse(f.read())
+
+def main():
+    aoc.run(__file__, aoc.input_file(__file__), read_input, part1, part2, stream=stream_input)
 
 if __name__ == '__main__':
     main()
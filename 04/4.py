@@ -3,53 +3,141 @@
 # https://adventofcode.com/2021/day/4 ("Bingo")
 # Author: Greg Hamerly
 
+import collections
+import os
 import sys
 
-def board_wins(board):
-    '''return true if any row or column sums to -5'''
-    return -5 in map(sum, board + list(zip(*board)))
-
-def score(board, n):
-    '''score is defined by the problem to be the sum of non-marked numbers times
-    the last number called (n)'''
-    # count non-marked entries by zeroing out the -1s
-    f = lambda x: max(0, x)
-    s = sum(sum(map(f, row)) for row in board)
-    return s * n
-
-def iterate_wins(numbers_called, boards):
-    '''keep calling numbers; yielding each board once it achieves a win'''
-    already_won = set()
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
+
+def build_index(boards):
+    '''Map each number to the list of (board, row, col) where it appears.'''
+    index = collections.defaultdict(list)
+    for board_ndx, board in enumerate(boards):
+        for r, row in enumerate(board):
+            for c, x in enumerate(row):
+                index[x].append((board_ndx, r, c))
+    return dict(index)
+
+def iterate_wins(numbers_called, boards, index):
+    '''keep calling numbers; yielding (board index, number, score) for each
+    board once it achieves a win. The score is defined by the problem to be
+    the sum of non-marked numbers times the last number called.
+
+    Each board keeps the number of marked cells in each row and column, and the
+    sum of its unmarked numbers, so calling a number only touches the boards
+    that contain it (found in the index). The boards are not modified.'''
+    row_hits = [[0] * 5 for _ in boards]
+    col_hits = [[0] * 5 for _ in boards]
+    unmarked = [sum(map(sum, board)) for board in boards]
+    already_won = [False] * len(boards)
+    called = set()
     for n in numbers_called:
-        for board_ndx, board in enumerate(boards):
-            if board_ndx in already_won:
+        if n in called:
+            continue
+        called.add(n)
+
+        for board_ndx, r, c in index.get(n, ()):
+            if already_won[board_ndx]:
                 continue
 
-            for row in board:
-                if n in row:
-                    row[row.index(n)] = -1
-                    break
+            unmarked[board_ndx] -= n
+            row_hits[board_ndx][r] += 1
+            col_hits[board_ndx][c] += 1
+            if row_hits[board_ndx][r] == 5 or col_hits[board_ndx][c] == 5:
+                already_won[board_ndx] = True
+                yield (board_ndx, n, unmarked[board_ndx] * n)
+
+def part1_iterate(numbers_called, boards):
+    '''stop when the first board has won'''
+    index = build_index(boards)
+    for board_ndx, n, score in iterate_wins(numbers_called, boards, index):
+        return score
+
+def part2_iterate(numbers_called, boards):
+    '''stop when the last board has won'''
+    index = build_index(boards)
+    for board_ndx, n, score in iterate_wins(numbers_called, boards, index):
+        pass
+    # use the fact that the last iteration's values are still available
+    return score
+
+# Since the order of the calls is known up front, there is no need to call them
+# one at a time. Give each number the rank (turn) at which it is first called; a
+# row or column is complete at the largest rank of its cells, and a board wins
+# at the smallest such rank over its rows and columns.
 
-            if board_wins(board):
-                already_won.add(board_ndx)
-                yield (board_ndx, n)
+def win_turns(numbers_called, boards):
+    '''Return (turns, scores): the turn (index into numbers_called) at which
+    each board wins, and its score. A board that never wins has the turn
+    len(numbers_called) and a score of 0. These are NumPy arrays, computed for
+    all of the boards at once, or lists without NumPy.'''
+    never = len(numbers_called)
+    np = numeric.numpy()
+
+    if np is None:
+        rank = {}
+        for turn, n in enumerate(numbers_called):
+            rank.setdefault(n, turn)
+        last_called = list(numbers_called) + [0]
+        turns, scores = [], []
+        for board in boards:
+            ranks = [[rank.get(x, never) for x in row] for row in board]
+            turn = min(min(map(max, ranks)), min(map(max, zip(*ranks))))
+            unmarked = sum(x for row, row_ranks in zip(board, ranks)
+                           for x, r in zip(row, row_ranks) if r > turn)
+            turns.append(turn)
+            scores.append(unmarked * last_called[turn])
+        return turns, scores
+
+    calls = np.asarray(numbers_called, dtype=np.int64)
+    cells = np.asarray(boards, dtype=np.int64).reshape(-1, 5, 5)
+    # the numbers called (sorted), and the turn each is first called; a cell is
+    # looked up among them by binary search, so large numbers cost nothing
+    values, first = np.unique(calls, return_index=True)
+    # a sentinel after the largest number, for the cells beyond it
+    values, first = np.append(values, 0), np.append(first, never)
+    at = np.searchsorted(values[:-1], cells)
+    ranks = np.where(values[at] == cells, first[at], never)
+    turns = np.minimum(ranks.max(axis=2).min(axis=1), ranks.max(axis=1).min(axis=1))
+    unmarked = np.where(ranks > turns[:, None, None], cells, 0).sum(axis=(1, 2))
+    # a board that never wins is scored with the 0 after the last call
+    last_called = np.append(calls, 0)[turns]
+    if int(abs(unmarked).max(initial=0)) * int(abs(last_called).max(initial=0)) >= 1 << 63:
+        # the scores do not fit in an int64
+        unmarked, last_called = unmarked.astype(object), last_called.astype(object)
+    scores = unmarked * last_called
+    return turns, scores
 
 def part1(numbers_called, boards):
-    '''stop when the first board has won''' 
-    for board_ndx, n in iterate_wins(numbers_called, boards):
-        return score(boards[board_ndx], n)
+    '''the score of the first board to win'''
+    turns, scores = win_turns(numbers_called, boards)
+    if not len(turns) or min(turns) == len(numbers_called):
+        return None
+    if numeric.is_array(turns):
+        np = numeric.numpy()
+        return int(scores[np.argmin(turns)])
+    # the first of the boards that win on the same turn
+    return scores[min(range(len(turns)), key=turns.__getitem__)]
 
 def part2(numbers_called, boards):
-    '''stop when the last board has won''' 
-    for board_ndx, n in iterate_wins(numbers_called, boards):
-        pass
-    # use the fact that the last iteration's values are still available
-    return score(boards[board_ndx], n)
+    '''the score of the last board to win'''
+    never = len(numbers_called)
+    turns, scores = win_turns(numbers_called, boards)
+    if not len(turns) or min(turns) == never:
+        return None
+    if numeric.is_array(turns):
+        np = numeric.numpy()
+        # the last of the boards that win on the same turn; boards that never
+        # win are ignored
+        won = np.where(turns < never, turns, -1)
+        return int(scores[len(won) - 1 - np.argmax(won[::-1])])
+    return scores[max((t, b) for b, t in enumerate(turns) if t < never)[1]]
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
+    '''Parse the numbers called and the 5x5 boards.'''
     with open(file) as f:
         lines = list(f)
 
@@ -60,8 +148,12 @@ def main():
         # assure the numbers are unique in each board
         assert len(set(sum(boards[-1], []))) == 25
 
-    print('part 1:', part1(numbers_called, boards))
-    print('part 2:', part2(numbers_called, boards))
+    return numbers_called, boards
+
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
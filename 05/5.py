@@ -3,17 +3,237 @@
 # https://adventofcode.com/2021/day/5 ("count intersections")
 # Author: Greg Hamerly
 
+import bisect
+import os
 import sys
 
-def count_intersections(lines, use_line):
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
+
+# the largest grid (in cells) that count_intersections_numpy() will allocate;
+# lines spread over a larger area are counted point by point in a dict, unless
+# they have more than DICT_CELLS points in all, when they are counted by
+# count_intersections_analytic() instead
+DENSE_CELLS = 1 << 24
+DICT_CELLS = 1 << 22
+# how many cells of the lines are rasterized at once
+BATCH_CELLS = 1 << 22
+
+def step(a, b):
+    '''the step from endpoint a towards b'''
+    return 0 if a == b else (b - a) // abs(b - a)
+
+def count_intersections_dict(segments):
     '''Iterate over each line (rasterizing the lines) and count the number of
-    points where more than one line touches. Filter out lines using the provided
-    use_line function.'''
+    points where more than one line touches. Each segment is (ax, ay, bx, by).'''
     counts = {}
 
-    # determine the step for endpoints a and b
-    step = lambda a, b: 0 if a == b else (b - a) // abs(b - a)
+    for ax, ay, bx, by in segments:
+        dx, dy = step(ax, bx), step(ay, by)
+
+        x, y = ax, ay
+        while x != bx + dx or y != by + dy:
+            counts[(x, y)] = counts.get((x, y), 0) + 1
+            x, y = x + dx, y + dy
+
+    intersections = [c for c in counts.values() if c >= 2]
+    return len(intersections)
+
+def count_intersections_numpy(segments):
+    '''Like count_intersections_dict(), for segments given as an (n, 4) NumPy
+    array. The cells of the lines are generated with arange (each line is its
+    start plus a multiple of its step), and counted with bincount in a dense
+    grid spanning the bounds of the lines.'''
+    np = numeric.numpy()
 
+    xs, ys = segments[:, 0::2], segments[:, 1::2]
+    x0, y0 = xs.min(), ys.min()
+    width = int(xs.max() - x0 + 1)
+    area = width * int(ys.max() - y0 + 1)
+
+    ax, ay = segments[:, 0] - x0, segments[:, 1] - y0
+    dx = np.sign(segments[:, 2] - segments[:, 0])
+    dy = np.sign(segments[:, 3] - segments[:, 1])
+    lengths = np.maximum(abs(segments[:, 2] - segments[:, 0]),
+                         abs(segments[:, 3] - segments[:, 1])) + 1
+    # the index of each line in the flattened grid, and its step there
+    starts = ay * width + ax
+    steps = dy * width + dx
+
+    grid = np.zeros(area, dtype=np.int64)
+    ends = np.cumsum(lengths)
+    low = 0
+    while low < len(segments):
+        # a batch of lines with about BATCH_CELLS cells in total (at least one
+        # line)
+        high = max(low + 1, int(np.searchsorted(ends, ends[low] - lengths[low] + BATCH_CELLS, 'right')))
+        n = lengths[low:high]
+        line = np.repeat(np.arange(low, high), n)
+        # how far along its line each cell is
+        offsets = np.arange(len(line)) - np.repeat(np.cumsum(n) - n, n)
+        grid += np.bincount(starts[line] + steps[line] * offsets, minlength=area)
+        low = high
+
+    return int(np.count_nonzero(grid >= 2))
+
+# count_intersections_analytic() never enumerates the points of the lines, so
+# its time depends on the number of lines and of crossings between them, and
+# not on how long the lines are.
+#
+# Every line belongs to one of four direction classes, and along it one linear
+# form a*x + b*y (its invariant) is constant. Lines of the same class and
+# invariant (a group) lie on the same infinite line, so they can only overlap
+# in intervals of a parameter along it (x, or y for vertical lines). Lines of
+# different groups meet in at most one point, a crossing.
+
+HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL = range(4)
+
+# the invariant of each class is a * x + b * y, for (a, b) =
+FORMS = ((0, 1), (1, 0), (1, -1), (1, 1))
+
+def classify(ax, ay, bx, by):
+    '''Return (class, invariant, low, high) of the line: low and high bound
+    its parameter (x, or y for vertical lines).'''
+    if ay == by:
+        return HORIZONTAL, ay, min(ax, bx), max(ax, bx)
+    if ax == bx:
+        return VERTICAL, ax, min(ay, by), max(ay, by)
+    cls = DIAGONAL if bx - ax == by - ay else ANTIDIAGONAL
+    a, b = FORMS[cls]
+    return cls, a * ax + b * ay, min(ax, bx), max(ax, bx)
+
+def invariant(cls, x, y):
+    a, b = FORMS[cls]
+    return a * x + b * y
+
+def parameter(cls, x, y):
+    return y if cls == VERTICAL else x
+
+def point(cls, inv, param):
+    '''the point of the line (cls, inv) at the given parameter'''
+    if cls == HORIZONTAL:
+        return param, inv
+    if cls == VERTICAL:
+        return inv, param
+    a, b = FORMS[cls]
+    return param, (inv - param) * b
+
+def crossing(p, c, q, d):
+    '''The lattice point on both the line of class p with invariant c and the
+    line of class q with invariant d, or None if they cross between lattice
+    points (a diagonal and an antidiagonal).'''
+    (a1, b1), (a2, b2) = FORMS[p], FORMS[q]
+    det = a1 * b2 - a2 * b1
+    x, rx = divmod(c * b2 - d * b1, det)
+    y, ry = divmod(a1 * d - a2 * c, det)
+    return None if rx or ry else (x, y)
+
+def coverage(intervals):
+    '''Given inclusive (low, high) intervals, return (union, doubles): the
+    sorted disjoint intervals covered at least once, and at least twice.'''
+    events = sorted([(low, 1) for low, _ in intervals] +
+                    [(high + 1, -1) for _, high in intervals])
+    union, doubles = [], []
+    depth = 0
+    for i, (x, delta) in enumerate(events):
+        depth += delta
+        # only look at the depth after the last event at x
+        if i + 1 < len(events) and events[i + 1][0] == x:
+            continue
+        end = events[i + 1][0] - 1 if i + 1 < len(events) else x
+        for spans, k in ((union, 1), (doubles, 2)):
+            if depth >= k:
+                if spans and spans[-1][1] == x - 1:
+                    spans[-1] = (spans[-1][0], end)
+                else:
+                    spans.append((x, end))
+    return union, doubles
+
+def crossings(p, p_lines, q, q_lines):
+    '''Yield the crossings of the lines of class p with those of class q. Each
+    line is (invariant, low, high).
+
+    In the coordinates (u, v) = (p invariant, q invariant), the lines of class
+    p are vertical and those of class q are horizontal. A sweep over u keeps
+    the sorted v of the q lines it is currently within, and looks up the range
+    of v that each p line spans.'''
+    def span(cls, inv, low, high, other):
+        ends = (invariant(other, *point(cls, inv, low)), invariant(other, *point(cls, inv, high)))
+        return min(ends), max(ends)
+
+    # sorted by u, then inserting, querying, and removing at the same u
+    events = []
+    for d, low, high in q_lines:
+        ulow, uhigh = span(q, d, low, high, p)
+        events.append((ulow, 0, d, d))
+        events.append((uhigh, 2, d, d))
+    for c, low, high in p_lines:
+        events.append((c, 1, *span(p, c, low, high, q)))
+    events.sort()
+
+    active = []
+    for u, kind, v, vhigh in events:
+        if kind == 0:
+            bisect.insort(active, v)
+        elif kind == 2:
+            del active[bisect.bisect_left(active, v)]
+        else:
+            for d in active[bisect.bisect_left(active, v):bisect.bisect_right(active, vhigh)]:
+                x = crossing(p, u, q, d)
+                if x is not None:
+                    yield x
+
+def count_intersections_analytic(segments):
+    '''Count the points where more than one of the segments (ax, ay, bx, by)
+    touch, without rasterizing them.
+
+    A point is counted once if it is covered twice within a group (it is in
+    the doubles of the group), or if it is a crossing of groups. So the count
+    is the sum of the doubles of the groups, corrected at each crossing p for
+    the m(p) groups whose doubles contain it: it should count once, rather than
+    m(p) times.'''
+    groups = {}
+    for s in segments:
+        cls, inv, low, high = classify(*s)
+        groups.setdefault((cls, inv), []).append((low, high))
+
+    unions = [[] for _ in FORMS]
+    doubles = {}
+    count = 0
+    for (cls, inv), intervals in groups.items():
+        union, two = coverage(intervals)
+        unions[cls].extend((inv, low, high) for low, high in union)
+        if two:
+            doubles[(cls, inv)] = two
+            count += sum(high - low + 1 for low, high in two)
+
+    points = set()
+    for p in range(len(FORMS)):
+        for q in range(p + 1, len(FORMS)):
+            points.update(crossings(p, unions[p], q, unions[q]))
+
+    for x, y in points:
+        m = 0
+        for cls in range(len(FORMS)):
+            two = doubles.get((cls, invariant(cls, x, y)))
+            if two:
+                t = parameter(cls, x, y)
+                i = bisect.bisect_right(two, (t, float('inf'))) - 1
+                m += i >= 0 and two[i][1] >= t
+        count += 1 - m
+
+    return count
+
+def count_intersections(lines, use_line):
+    '''Count the number of points where more than one line touches. Filter out
+    lines using the provided use_line function. The lines may be any iterable.
+
+    The lines are rasterized with NumPy into a dense grid if it is small
+    enough, or else point by point into a dict if they are short enough, or
+    else counted analytically.'''
+    segments = []
     for (ax, ay), (bx, by) in lines:
         if not use_line(ax, ay, bx, by):
             continue
@@ -21,16 +241,27 @@ def count_intersections(lines, use_line):
         dx, dy = step(ax, bx), step(ay, by)
 
         # make sure the line is horizontal, vertical, or diagonal
-        assert dx in (-1, 0, 1) and dy in (-1, 0, 1)
+        assert dx == 0 or dy == 0 or abs(bx - ax) == abs(by - ay)
         assert dx != 0 or dy != 0
 
-        x, y = ax, ay
-        while x != bx + dx or y != by + dy:
-            counts[(x, y)] = counts.get((x, y), 0) + 1
-            x, y = x + dx, y + dy
+        segments.append((ax, ay, bx, by))
 
-    intersections = [c for c in counts.values() if c >= 2]
-    return len(intersections)
+    if not segments:
+        return 0
+
+    np = numeric.numpy()
+
+    if np is not None:
+        xs = [s[0] for s in segments] + [s[2] for s in segments]
+        ys = [s[1] for s in segments] + [s[3] for s in segments]
+        area = (max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1)
+        if area <= DENSE_CELLS:
+            return count_intersections_numpy(np.array(segments, dtype=np.int64))
+
+    cells = sum(max(abs(bx - ax), abs(by - ay)) + 1 for ax, ay, bx, by in segments)
+    if cells <= DICT_CELLS:
+        return count_intersections_dict(segments)
+    return count_intersections_analytic(segments)
 
 def part1(lines):
     '''Count intersections of only horizontal lines.'''
@@ -48,17 +279,17 @@ def parse(line):
 
     return (start, end)
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
-    with open(file) as f:
-        lines = list(f)
+def stream_input(f):
+    return map(parse, f)
 
-    lines = list(map(parse, lines))
+def read_input(file):
+    with aoc.open_input(file) as f:
+        return list(stream_input(f))
 
-    print('part 1:', part1(lines))
-    print('part 2:', part2(lines))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2, stream=stream_input)
 
 if __name__ == '__main__':
     main()
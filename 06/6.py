@@ -4,26 +4,180 @@
 # Author: Greg Hamerly
 
 import collections
+import os
 import sys
 
-def simulate(init_counts, days):
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
+
+def histogram(init_counts, timers):
+    '''The number of fish with each count (0 ... timers - 1), in one pass
+    over the counts. A count outside of that range raises ValueError.'''
+    if numeric.is_array(init_counts):
+        np = numeric.numpy()
+        if len(init_counts) and not 0 <= init_counts.min() <= init_counts.max() < timers:
+            raise ValueError(f'fish counts must be between 0 and {timers - 1}')
+        return [int(c) for c in np.bincount(init_counts, minlength=timers)]
+    hist = [0] * timers
+    for f, count in collections.Counter(init_counts).items():
+        if not 0 <= f < timers:
+            raise ValueError(f'fish count {f} is not between 0 and {timers - 1}')
+        hist[f] += count
+    return hist
+
+def mat_mul(a, b):
+    cols = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, col)) for col in cols] for row in a]
+
+def mat_vec(m, v):
+    return [sum(x * y for x, y in zip(row, v)) for row in m]
+
+class PowerLadder:
+    '''The powers m, m ** 2, m ** 4, ... of a matrix, computed as needed and
+    kept for later queries.'''
+
+    def __init__(self, m):
+        self.powers = [m]
+
+    def power(self, k):
+        '''m ** (2 ** k)'''
+        while len(self.powers) <= k:
+            self.powers.append(mat_mul(self.powers[-1], self.powers[-1]))
+        return self.powers[k]
+
+    def apply(self, v, n):
+        '''m ** n times the vector v'''
+        k = 0
+        while n:
+            if n & 1:
+                v = mat_vec(self.power(k), v)
+            n >>= 1
+            k += 1
+        return v
+
+    def matrix(self, n):
+        '''m ** n'''
+        size = len(self.powers[0])
+        result = [[int(i == j) for j in range(size)] for i in range(size)]
+        k = 0
+        while n:
+            if n & 1:
+                result = mat_mul(self.power(k), result)
+            n >>= 1
+            k += 1
+        return result
+
+class Species:
+    '''A population whose members count down by one each day; a member at zero
+    resets to the reset count and creates 'offspring' new members at the
+    spawn count. Members are grouped by their count, in a histogram.
+
+    One day is a linear map of the histogram: new[i] = sum of step[i][j] *
+    old[j]. So 'days' days is the matrix step ** days, which is computed by
+    squaring in O(log days) matrix products (on Python ints, which do not
+    overflow).'''
+
+    def __init__(self, reset=6, spawn=8, offspring=1):
+        self.reset = reset
+        self.spawn = spawn
+        self.offspring = offspring
+        self.timers = max(reset, spawn) + 1
+        self._ladder = None
+
+    def histogram(self, init_counts):
+        return histogram(init_counts, self.timers)
+
+    def simulate_steps(self, init_counts, days):
+        '''Simulate one day at a time. The histogram is a ring buffer, where
+        the count of a slot is its distance from the head; a day moves the head
+        on by one, instead of moving every slot down.'''
+        counts = self.histogram(init_counts)
+        timers = self.timers
+        head = 0
+        for i in range(days):
+            zeros = counts[head]
+            counts[head] = 0
+            head = (head + 1) % timers
+            counts[(head + self.reset) % timers] += zeros
+            counts[(head + self.spawn) % timers] += zeros * self.offspring
+
+        return sum(counts)
+
+    def step_matrix(self):
+        '''The matrix of one day.'''
+        m = [[0] * self.timers for _ in range(self.timers)]
+        for f in range(1, self.timers):
+            m[f - 1][f] = 1
+        m[self.reset][0] += 1
+        m[self.spawn][0] += self.offspring
+        return m
+
+    def ladder(self):
+        '''The power ladder of the step matrix, shared by all simulations.'''
+        if self._ladder is None:
+            self._ladder = PowerLadder(self.step_matrix())
+        return self._ladder
+
+    def simulate(self, init_counts, days):
+        '''Like simulate_steps(), in O(log days) matrix-vector products.'''
+        return sum(self.ladder().apply(self.histogram(init_counts), days))
+
+    def simulate_many(self, init_counts, days):
+        '''The number of members after each of the given numbers of days.
+        Later numbers of days start from the histogram of the previous one (when
+        it is no larger), so each query only applies the difference.'''
+        totals = {}
+        previous, v = 0, self.histogram(init_counts)
+        for d in sorted(set(days)):
+            v = self.ladder().apply(v, d - previous)
+            previous = d
+            totals[d] = sum(v)
+        return [totals[d] for d in days]
+
+    def simulate_batch(self, populations, days):
+        '''The number of members of each of many populations after each of the
+        given numbers of days, as a NumPy array (populations, days).
+        populations is an array (or list of rows) of histograms.
+
+        A population of histogram h has sum(step ** d @ h) members after d
+        days, which is h dotted with the column sums of step ** d. So all of
+        the answers are one matrix product, of the histograms with a matrix of
+        those column sums. It is done with int64 if that cannot overflow, and
+        with Python ints (dtype object) otherwise. This needs NumPy.'''
+        np = numeric.numpy()
+        if np is None:
+            raise ImportError('simulate_batch() needs NumPy')
+
+        weights = [[sum(col) for col in zip(*self.ladder().matrix(d))] for d in days]
+        populations = np.asarray(populations)
+        largest = max((max(w) for w in weights), default=0)
+        sizes = populations.sum(axis=1) if populations.size else np.zeros(0, dtype=np.int64)
+        if largest * max(1, int(sizes.max(initial=0))) < 1 << 63:
+            w = np.array(weights, dtype=np.int64).reshape(len(days), self.timers)
+            return populations.astype(np.int64) @ w.T
+        w = np.array(weights, dtype=object).reshape(len(days), self.timers)
+        return populations.astype(object) @ w.T
+
+LANTERNFISH = Species(reset=6, spawn=8, offspring=1)
+
+def simulate_steps(init_counts, days):
     '''Simulate 'days' steps according to the rules given in the problem:
         - each fish steps down by one count each day
         - when a fish reaches zero, it respawns with a count of 6 and creates
           another new fish with a count of 8
     Speed things up significantly by grouping all fish of the same count.'''
-    counts = {f: init_counts.count(f) for f in init_counts}
-    for i in range(days):
-        new_counts = collections.defaultdict(int)
-        for f, count in counts.items():
-            if f == 0:
-                new_counts[6] += count
-                new_counts[8] += count
-            else:
-                new_counts[f-1] += count
-        counts = new_counts
-
-    return sum(counts.values())
+    return LANTERNFISH.simulate_steps(init_counts, days)
+
+def simulate_matrix(init_counts, days):
+    '''Like simulate_steps(), with powers of the step matrix.'''
+    return LANTERNFISH.simulate(init_counts, days)
+
+def simulate_many(init_counts, days):
+    return LANTERNFISH.simulate_many(init_counts, days)
+
+simulate = simulate_matrix
 
 def part1(init_counts):
     '''Do a simulation for 80 days'''
@@ -33,17 +187,14 @@ def part2(init_counts):
     '''Do a simulation for 256 days'''
     return simulate(init_counts, 256)
 
+def read_input(file):
+    '''The input is a single line of comma-separated integers.'''
+    return numeric.load_ints(file)
+
 def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
+    file = aoc.input_file(__file__)
     print(f'using input: {file}')
-    with open(file) as f:
-        lines = list(f)
-
-    init_counts = list(map(int, lines[0].split(',')))
-
-    print('part 1:', part1(init_counts))
-    print('part 2:', part2(init_counts))
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
@@ -3,16 +3,98 @@
 # https://adventofcode.com/2021/day/7 -- "crab fuel"
 # Author: Greg Hamerly
 
+import collections
+import itertools
+import os
+import random
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
+
+def distance(x):
+    '''The cost of part 1.'''
+    return x
+
+def triangular(x):
+    '''The cost of part 2: 1 + 2 + ... + x.'''
+    return x * (x + 1) // 2
+
+class CostTable:
+    '''A dense histogram of the positions over [low, high], with prefix sums
+    of count, count * p and count * p^2 (for p counted from low). With them,
+    the total distance or triangular cost of moving to any position takes
+    O(1), since the sums of d and d^2 over the positions on either side of it
+    are polynomials in the position with those sums as coefficients.'''
+
+    COSTS = (distance, triangular)
+
+    def __init__(self, positions):
+        self.numpy = numeric.is_array(positions)
+        if self.numpy:
+            np = numeric.numpy()
+            self.low, self.high = int(positions.min()), int(positions.max())
+            span = self.high - self.low + 1
+            # sums of count * p^2 may not fit in int64
+            dtype = np.int64 if len(positions) * span * span < 1 << 62 else object
+            counts = np.bincount(positions - self.low, minlength=span).astype(dtype)
+            p = np.arange(span).astype(dtype)
+            self.s0, self.s1, self.s2 = (np.concatenate(([0], np.cumsum(c))).astype(dtype)
+                                         for c in (counts, counts * p, counts * p * p))
+        else:
+            self.low, self.high = min(positions), max(positions)
+            counts = [0] * (self.high - self.low + 1)
+            for q in positions:
+                counts[q - self.low] += 1
+            self.s0, self.s1, self.s2 = (list(itertools.accumulate(c, initial=0))
+                                         for c in (counts, (c * p for p, c in enumerate(counts)),
+                                                   (c * p * p for p, c in enumerate(counts))))
+
+    def _costs(self, pos, below, below_sum):
+        '''The total distance and the total squared distance to pos (counted
+        from low), given the count and the sum of the positions up to it.'''
+        n, total, squares = self.s0[-1], self.s1[-1], self.s2[-1]
+        dist = (pos * below - below_sum) + (total - below_sum) - pos * (n - below)
+        squared = n * pos * pos - 2 * pos * total + squares
+        return dist, squared
+
+    def fuel(self, pos, cost):
+        '''The total cost of moving every crab to pos (cost is one of COSTS).'''
+        if cost not in self.COSTS:
+            raise ValueError(f'CostTable cannot score the cost {cost!r}')
+        i = min(max(pos - self.low, -1), self.high - self.low)
+        below, below_sum = (self.s0[i + 1], self.s1[i + 1])
+        dist, squared = self._costs(pos - self.low, below, below_sum)
+        return int(dist if cost is distance else (squared + dist) // 2)
+
+    def curve(self, cost):
+        '''The total cost of moving to each of the positions low ... high, as
+        an array (a list without NumPy).'''
+        if cost not in self.COSTS:
+            raise ValueError(f'CostTable cannot score the cost {cost!r}')
+        if self.numpy:
+            np = numeric.numpy()
+            pos = np.arange(self.high - self.low + 1).astype(self.s0.dtype)
+            dist, squared = self._costs(pos, self.s0[1:], self.s1[1:])
+            return dist if cost is distance else (squared + dist) // 2
+        return [self.fuel(p, cost) for p in range(self.low, self.high + 1)]
+
 def least_fuel_linear(positions, cost):
     '''Turn a list of positions into a list of positions and counts. Then score
     each of those positions according to the given cost function, and return the
     minimum score over all positions.
 
     This was my first solution, but I was not satisfied with it. So I wrote the
-    ternary search below.'''
-    pos_count = {p: positions.count(p) for p in positions}
+    ternary search below.
+
+    For the costs of the problem, every position is scored with a CostTable
+    instead, in O(range + n) in all.'''
+    if cost in CostTable.COSTS:
+        return int(min(CostTable(positions).curve(cost)))
+
+    pos_count = collections.Counter(map(int, positions))
     score = lambda pos: sum(cost(abs(p - pos)) * count for p, count in pos_count.items())
     return min(map(score, range(min(pos_count), max(pos_count) + 1)))
 
@@ -23,7 +105,7 @@ def least_fuel_ternary(positions, cost):
 
     But, since the problem implicitly seems to require integer position answers,
     use the best position to find the best nearest integer position.'''
-    positions = {p: positions.count(p) for p in positions}
+    positions = collections.Counter(map(int, positions))
     score = lambda pos: sum(cost(abs(p - pos)) * positions[p] for p in positions)
 
     low, high = min(positions), max(positions)
@@ -43,26 +125,81 @@ def least_fuel_ternary(positions, cost):
 # use ternary search
 least_fuel = least_fuel_ternary
 
+# For the two costs of the problem, the best position is known in closed form.
+# The total distance is least at a median of the positions. The total
+# triangular cost (d^2 + d) / 2 is least within 1/2 of the mean, because its
+# derivative is the sum of (pos - p) + sign(pos - p) / 2 over the positions.
+
+def select(values, k):
+    '''The k-th smallest (counting from 0) of the values, in expected linear
+    time: np.partition with NumPy, or else quickselect.'''
+    if numeric.is_array(values):
+        np = numeric.numpy()
+        return int(np.partition(values, k)[k])
+
+    values = list(values)
+    while True:
+        pivot = random.choice(values)
+        lows = [v for v in values if v < pivot]
+        if k < len(lows):
+            values = lows
+            continue
+        k -= len(lows)
+        equal = sum(1 for v in values if v == pivot)
+        if k < equal:
+            return int(pivot)
+        k -= equal
+        values = [v for v in values if v > pivot]
+
+def position_counts(positions):
+    '''A histogram of the positions, as a dict.'''
+    if numeric.is_array(positions):
+        np = numeric.numpy()
+        low = int(positions.min())
+        counts = np.bincount(positions - low)
+        values = np.flatnonzero(counts)
+        return dict(zip((values + low).tolist(), counts[values].tolist()))
+    return collections.Counter(map(int, positions))
+
+def fuel(pos_count, pos, cost):
+    '''The total cost of moving the crabs (a histogram of their positions) to
+    pos.'''
+    return sum(cost(abs(p - pos)) * count for p, count in pos_count.items())
+
+def least_fuel_median(positions):
+    '''The least total distance, which is the distance to the median.'''
+    median = select(positions, (len(positions) - 1) // 2)
+    if numeric.is_array(positions):
+        np = numeric.numpy()
+        return int(np.abs(positions - median).sum())
+    return sum(abs(p - median) for p in positions)
+
+def least_fuel_mean(positions):
+    '''The least total triangular cost, found around the mean (its floor and
+    ceiling, and their neighbours). All of them are scored with one
+    histogram.'''
+    total = positions.sum() if numeric.is_array(positions) else sum(positions)
+    mean = int(total) // len(positions)
+    pos_count = position_counts(positions)
+    return min(fuel(pos_count, p, triangular) for p in range(mean - 1, mean + 3))
+
 def part1(positions):
     '''The cost is just the distance.'''
-    return least_fuel(positions, lambda x: x)
+    return least_fuel_median(positions)
 
 def part2(positions):
     '''The cost is n(n+1)/2 for a distance of n, because of the identity
     sum(1,2,...,n) = n(n+1)/2.'''
-    return least_fuel(positions, lambda x: x * (x + 1) // 2)
+    return least_fuel_mean(positions)
+
+def read_input(file):
+    '''The input is a single line of comma-separated integers.'''
+    return numeric.load_ints(file)
 
 def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
+    file = aoc.input_file(__file__)
     print(f'using input: {file}')
-    with open(file) as f:
-        lines = list(f)
-
-    positions = list(map(int, lines[0].split(',')))
-
-    print('part 1:', part1(positions))
-    print('part 2:', part2(positions))
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
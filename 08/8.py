@@ -5,10 +5,20 @@
 
 # This code is really overkill. There are way too many sorts, and I'm sure
 # there's a faster way than brute-forcing every permutation. But it's 1 AM and
-# I'm a working father.
+# I'm a working father. (Later: decode_deductive() and decode_signature() are
+# faster ways; part2 now uses the signatures.)
 
+import collections
+import functools
 import itertools
+import os
 import sys
+from array import array
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import numeric
 
 def part1(lines):
     '''This part is simple, just count how many of the numbers have 2, 3, 4, or
@@ -55,7 +65,25 @@ SEGMENTS = {
         9: 'abcdfg'
         }
 
-SEGMENTS_REV = {pattern: digit for digit, pattern in SEGMENTS.items()}
+@functools.lru_cache(maxsize=None)
+def segments_rev():
+    '''The reverse of SEGMENTS (pattern -> digit), built on first use.'''
+    return {pattern: digit for digit, pattern in SEGMENTS.items()}
+
+# Over the ten patterns of a line, each segment is on in a fixed number of them
+# (e.g. e in 4 and f in 9), however the wires are crossed. The sum of those
+# numbers over the segments of a digit (its signature) is different for every
+# digit, so it identifies the digit without working out the wiring.
+
+@functools.lru_cache(maxsize=None)
+def signature_table():
+    '''A tuple mapping each signature (0 ... 49) to its digit, or to -1 if no
+    digit has it; built on first use.'''
+    frequency = collections.Counter(''.join(SEGMENTS.values()))
+    signatures = {sum(frequency[c] for c in pattern): digit
+                  for digit, pattern in SEGMENTS.items()}
+    assert len(signatures) == len(SEGMENTS)
+    return tuple(signatures.get(sig, -1) for sig in range(sum(frequency.values()) + 1))
 
 def consistent(permutation, ten_patterns):
     '''Identify whether the permutation (ordering of a-g) is consistent with the
@@ -84,40 +112,130 @@ def find_permutation(ten_patterns):
     assert len(answer) == 1, answer
     return answer[0]
 
-def part2(lines):
-    '''Find a permutation of the segments that is consistent with the data, use
-    that to build a 4-digit number, and add up those 4-digit numbers.'''
-    ans = 0
-    for line in lines:
-        ten_patterns, numbers = line.split(' | ')
-        ten_patterns = [''.join(sorted(w)) for w in ten_patterns.split()]
-        numbers = numbers.split()
-
-        # brute-force a solution...
-        mapping = find_permutation(ten_patterns)
-
-        s = 0
-        for n in numbers:
-            # sanity checking
-            #n_sorted = ''.join(sorted(n))
-            #assert n_sorted in ten_patterns
+def decode_brute(line):
+    '''Find a permutation of the segments that is consistent with the data, and
+    use that to build the 4-digit number of the line.'''
+    segments_to_digit = segments_rev()
+    ten_patterns, numbers = line.split(' | ')
+    ten_patterns = [''.join(sorted(w)) for w in ten_patterns.split()]
+    numbers = numbers.split()
+
+    # brute-force a solution...
+    mapping = find_permutation(ten_patterns)
+
+    s = 0
+    for n in numbers:
+        # sanity checking
+        #n_sorted = ''.join(sorted(n))
+        #assert n_sorted in ten_patterns
+
+        # invert the mapping to look up the digit
+        n_mapped = ''.join(sorted(['abcdefg'[mapping.index(c)] for c in n]))
+        s = s * 10 + segments_to_digit[n_mapped]
+    return s
+
+# the bit of each segment in a bitmask
+SEGMENT_BITS = {c: 1 << i for i, c in enumerate('abcdefg')}
+
+def mask(pattern):
+    '''The pattern as a bitmask of its segments (bit 0 is a, ..., bit 6 is g).'''
+    return sum(map(SEGMENT_BITS.__getitem__, pattern))
+
+def decode_deductive(line):
+    '''Deduce which pattern is which digit, and use that to build the 4-digit
+    number of the line. The patterns are bitmasks of their segments.
+
+    The digits 1, 4, 7 and 8 are the only ones with 2, 4, 3 and 7 segments.
+    Of those with 6 segments, 9 is the one that contains 4, and 0 the other one
+    that contains 1; the last is 6. Of those with 5 segments, 3 is the one that
+    contains 1, and 5 the one contained in 6; the last is 2.'''
+    ten_patterns, numbers = line.split(' | ')
+    by_length = {}
+    for w in ten_patterns.split():
+        by_length.setdefault(len(w), []).append(mask(w))
+
+    (one,), (four,), (seven,), (eight,) = by_length[2], by_length[4], by_length[3], by_length[7]
+    digits = {one: 1, four: 4, seven: 7, eight: 8}
+    for m in by_length[6]:
+        if (m & four) == four:
+            digits[m] = 9
+        elif (m & one) == one:
+            digits[m] = 0
+        else:
+            digits[m] = 6
+            six = m
+    for m in by_length[5]:
+        if (m & one) == one:
+            digits[m] = 3
+        elif (m & six) == m:
+            digits[m] = 5
+        else:
+            digits[m] = 2
+
+    s = 0
+    for n in numbers.split():
+        s = s * 10 + digits[mask(n)]
+    return s
+
+def decode_signature(line):
+    '''Look up each digit of the line's 4-digit number by its signature.'''
+    ten_patterns, numbers = line.split(' | ')
+    frequency = collections.Counter(ten_patterns)
+    table = signature_table()
+    s = 0
+    for n in numbers.split():
+        s = s * 10 + table[sum(map(frequency.__getitem__, n))]
+    return s
+
+# use the signatures
+decode = decode_signature
+
+# lines decoded at once by decode_batch()
+BATCH_LINES = 1 << 14
+
+def decode_batch(lines):
+    '''The 4-digit numbers of many lines, as an integer array (array('q')
+    without NumPy).
+
+    With NumPy, each batch of lines is turned into a (lines, 14) array of the
+    7-bit masks of its patterns and outputs. The signatures of the outputs are
+    then their bits dotted with the frequencies of the segments in the
+    patterns, and the digits are looked up in the signature table.'''
+    np = numeric.numpy()
+    if np is None:
+        return array('q', map(decode_signature, lines))
+
+    table = np.array(signature_table(), dtype=np.int64)
+    places = np.array([1000, 100, 10, 1], dtype=np.int64)
+    numbers = []
+    for low in range(0, len(lines), BATCH_LINES):
+        data = np.frombuffer('\n'.join(lines[low:low + BATCH_LINES]).encode(), dtype=np.uint8)
+        letter = (data >= ord('a')) & (data <= ord('g'))
+        # the index of the word of each letter
+        word = np.cumsum(letter & ~np.concatenate(([False], letter[:-1]))) - 1
+        masks = np.bincount(word[letter], weights=np.left_shift(1, data[letter] - ord('a')))
+        masks = masks.astype(np.uint8).reshape(-1, 14)
+
+        bits = np.unpackbits(masks[:, :, None], axis=2, bitorder='little')[:, :, :7].astype(np.int64)
+        frequency = bits[:, :10].sum(axis=1)
+        signatures = np.einsum('nkw,nw->nk', bits[:, 10:], frequency)
+        numbers.append(table[signatures] @ places)
+
+    return np.concatenate(numbers) if numbers else np.zeros(0, dtype=np.int64)
 
-            # invert the mapping to look up the digit
-            n_mapped = ''.join(sorted(['abcdefg'[mapping.index(c)] for c in n]))
-            s = s * 10 + SEGMENTS_REV[n_mapped]
-        ans += s
+def part2(lines):
+    '''Decode the 4-digit number of each line, and add up those numbers.'''
+    numbers = decode_batch(lines)
+    return int(numbers.sum()) if numeric.is_array(numbers) else sum(numbers)
 
-    return ans
+def read_input(file):
+    with open(file) as f:
+        return list(f)
 
 def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
+    file = aoc.input_file(__file__)
     print(f'using input: {file}')
-    with open(file) as f:
-        lines = list(f)
-
-    print('part 1:', part1(lines))
-    print('part 2:', part2(lines))
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
@@ -3,59 +3,65 @@
 # https://adventofcode.com/2021/day/9 - "lava tubes"
 # Author: Greg Hamerly
 
-import itertools
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc.grid import Grid
+
 def low_points(heightmap):
     '''Find all the 'low points', which are defined as those cells in the
     heightmap that are lower than all 4 NSEW adjacent cells (of those that
-    exist).'''
-    on_map = lambda i, j: 0 <= i < len(heightmap) and 0 <= j < len(heightmap[i])
-    
-    for i, row in enumerate(heightmap):
-        for j, col in enumerate(row):
-            for ii, jj in [(i-1,j), (i+1,j), (i,j-1), (i,j+1)]:
-                if (ii == i and jj == j) or not on_map(ii, jj):
-                    continue
-                if heightmap[ii][jj] <= heightmap[i][j]:
-                    break
-            else:
-                yield (i, j)
+    exist). The heightmap is padded with 9s, so every cell has 4 neighbours.'''
+    cells = heightmap.cells
+    offsets = heightmap.offsets4
+    for i in heightmap.interior():
+        h = cells[i]
+        for o in offsets:
+            if cells[i + o] <= h:
+                break
+        else:
+            yield i
 
 def part1(heightmap):
     '''Sum the heights of each of the low points (adding one to the height of
     each of them before summing).'''
-    return sum(heightmap[i][j] + 1 for (i, j) in low_points(heightmap))
+    return sum(heightmap[i] + 1 for i in low_points(heightmap))
 
-def basin_size_nonrec(heightmap, seen, i, j):
-    '''Fill in the basin, starting at (i, j), and return the number of cells
+def basin_size_nonrec(heightmap, seen, i):
+    '''Fill in the basin, starting at cell i, and return the number of cells
     belonging to the basin. Uses non-recursive DFS.'''
-    assert (i, j) not in seen
-    q = [(i, j)]
-    seen.add((i, j))
+    assert not seen[i]
+    cells = heightmap.cells
+    offsets = heightmap.offsets4
+    q = [i]
+    seen[i] = 1
     size = 1
-    on_map = lambda i, j: 0 <= i < len(heightmap) and 0 <= j < len(heightmap[i])
     while q:
-        i, j = q.pop()
-        for ii, jj in [(i-1,j), (i+1,j), (i,j-1), (i,j+1)]:
-            # the problem defines 9 as a boundary for basins
-            if on_map(ii, jj) and heightmap[ii][jj] != 9 and (ii,jj) not in seen:
-                seen.add((ii, jj))
+        i = q.pop()
+        for o in offsets:
+            ii = i + o
+            # the problem defines 9 as a boundary for basins (and the padding
+            # around the map is 9s)
+            if cells[ii] != 9 and not seen[ii]:
+                seen[ii] = 1
                 size += 1
-                q.append((ii, jj))
+                q.append(ii)
     return size
 
-def basin_size_rec(heightmap, seen, i, j):
-    '''Fill in the basin, starting at (i, j), and return the number of cells
+def basin_size_rec(heightmap, seen, i):
+    '''Fill in the basin, starting at cell i, and return the number of cells
     belonging to the basin. Uses recursive DFS.'''
-    assert (i, j) not in seen
-    seen.add((i, j))
-    on_map = lambda i, j: 0 <= i < len(heightmap) and 0 <= j < len(heightmap[i])
+    assert not seen[i]
+    seen[i] = 1
     size = 1
-    for ii, jj in [(i-1,j), (i+1,j), (i,j-1), (i,j+1)]:
+    for o in heightmap.offsets4:
+        ii = i + o
         # the problem defines 9 as a boundary for basins
-        if on_map(ii, jj) and heightmap[ii][jj] != 9 and (ii,jj) not in seen:
-            size += basin_size_rec(heightmap, seen, ii, jj)
+        if heightmap[ii] != 9 and not seen[ii]:
+            size += basin_size_rec(heightmap, seen, ii)
     return size
 
 basin_size = basin_size_nonrec
@@ -63,21 +69,18 @@ basin_size = basin_size_nonrec
 def part2(heightmap):
     '''Find the sizes of all the basins, and return the product of the sizes of
     three largest basins.'''
-    seen = set()
-    sizes = sorted(basin_size(heightmap, seen, i, j) for (i, j) in low_points(heightmap))
+    seen = bytearray(len(heightmap.cells))
+    sizes = sorted(basin_size(heightmap, seen, i) for i in low_points(heightmap))
     return sizes[-3] * sizes[-2] * sizes[-1]
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(f)
+        return Grid.from_lines(f, pad=1, border=9)
 
-    heightmap = [list(map(int, line.strip())) for line in lines]
-
-    print('part 1:', part1(heightmap))
-    print('part 2:', part2(heightmap))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
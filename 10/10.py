@@ -8,8 +8,13 @@
 # initialization bug where I forgot to reset the stack cost me a lot on the
 # second task.
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+
 def parse(line, mismatch=None, complete=None):
     '''Try to balance the parentheses on the line. Stop when we get a mismatch
     (and call the function "mismatch" with the offending character) or when we
@@ -34,11 +39,12 @@ def part1(lines):
     '''Add up the values associated with the first closing characters on each
     line that are incorrectly balanced (if any).'''
     score = { ')': 3, ']': 57, '}': 1197, '>': 25137 }
-    return sum(filter(None, [parse(line, score.__getitem__) for line in lines]))
+    return sum(filter(None, (parse(line, score.__getitem__) for line in lines)))
 
 def part2(lines):
     '''Add up the values computed from completing each line that had some open
-    parentheses left after a correctly-parsed line.'''
+    parentheses left after a correctly-parsed line. Finding the median needs
+    the scores of all the incomplete lines, but not the lines themselves.'''
     def complete(s):
         score = { '(': 1, '[': 2, '{': 3, '<': 4 }
         line_score = 0
@@ -50,17 +56,17 @@ def part2(lines):
     scores = sorted(filter(None, map(p, lines)))
     return scores[len(scores) // 2]
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
-    with open(file) as f:
-        lines = list(f)
+def stream_input(f):
+    return map(str.strip, f)
 
-    lines = list(map(str.strip, lines))
+def read_input(file):
+    with aoc.open_input(file) as f:
+        return list(stream_input(f))
 
-    print('part 1:', part1(lines))
-    print('part 2:', part2(lines))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2, stream=stream_input)
 
 if __name__ == '__main__':
     main()
@@ -3,8 +3,14 @@
 # https://adventofcode.com/2021/day/11 - "flashing octopi"
 # Author: Greg Hamerly
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc.grid import Grid
+
 def iterate_board(board, max_iters, flashed_functor):
     '''Iterate the process described in the problem of adding one to every cell,
     and "flashing" whenever a cell reaches 10. Flashes add one to neighboring
@@ -13,41 +19,39 @@ def iterate_board(board, max_iters, flashed_functor):
     with the current iteration and the number of flashed cells. Stop iterating
     early if flashed_functor returns True.'''
 
+    # the board is padded with -1s, which never flash; a cell that has flashed
+    # during an iteration is 0 until the next iteration
+    board = board.copy()
+    cells = board.cells
+    interior = list(board.interior())
+    offsets = board.offsets8
+
     for iteration in range(1, max_iters + 1):
         # add one to each cell and find the initial set of flashes
         flashes = []
-        flashed = set()
-        bnew = [[ri + 1 for ri in row] for row in board]
-        for i, row in enumerate(bnew):
-            for j, col in enumerate(row):
-                if col >= 10:
-                    flashes.append((i, j))
-                    flashed.add((i, j))
-                    bnew[i][j] = 0
+        for i in interior:
+            cells[i] += 1
+            if cells[i] >= 10:
+                flashes.append(i)
+                cells[i] = 0
+        num_flashed = len(flashes)
 
-        # now do a sort of BFS for all other flashes
+        # now do a sort of DFS for all other flashes
         while flashes:
-            new_flashes = []
-            for i, j in flashes:
-                for ii in range(i-1, i+2):
-                    for jj in range(j-1, j+2):
-                        if ii == i and jj == j or (ii, jj) in flashed:
-                            continue
-                        if not (0 <= ii < len(bnew) and 0 <= jj < len(bnew[ii])):
-                            continue
-
-                        bnew[ii][jj] += 1
-                        if bnew[ii][jj] >= 10:
-                            new_flashes.append((ii, jj))
-                            flashed.add((ii, jj))
-                            bnew[ii][jj] = 0
+            i = flashes.pop()
+            for o in offsets:
+                ii = i + o
+                if cells[ii] <= 0:
+                    continue
 
-            flashes = new_flashes
-
-        board = bnew
+                cells[ii] += 1
+                if cells[ii] >= 10:
+                    flashes.append(ii)
+                    num_flashed += 1
+                    cells[ii] = 0
 
         # call the given functor
-        if flashed_functor(iteration, len(flashed)):
+        if flashed_functor(iteration, num_flashed):
             return
 
 def part1(board):
@@ -64,23 +68,20 @@ def part2(board):
     ans = None
     def all_flashed(iteration, flashed):
         nonlocal ans
-        if flashed == len(board) * len(board[0]):
+        if flashed == len(board):
             ans = iteration
             return True
     iterate_board(board, 10000, all_flashed)
     return ans
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
-
-    board = [list(map(int, line)) for line in lines]
+        return Grid.from_lines(f, pad=1, border=-1)
 
-    print('part 1:', part1(board))
-    print('part 2:', part2(board))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
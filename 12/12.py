@@ -5,6 +5,11 @@
 
 import sys
 import collections
+import os
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
 
 def dfs(graph, visit_count, current, two_small_allowed, path):
     '''Perform a DFS on the graph at the current node. Visit "small" (lowercase)
@@ -58,17 +63,14 @@ def parse(lines):
         graph[v].add(u)
     return graph
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return parse(map(str.strip, f))
 
-    graph = parse(lines)
-
-    print('part 1:', part1(graph))
-    print('part 2:', part2(graph))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
@@ -3,8 +3,13 @@
 # https://adventofcode.com/2021/day/13 - "transparent origami"
 # Author: Greg Hamerly
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+
 def display(points):
     '''Render the current board as a grid.'''
     max_y = max(y for x, y in points)
@@ -46,15 +51,14 @@ def part2(lines):
     points = fold(lines, len(lines))
     return '\n' + display(points)
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return list(map(str.strip, f))
 
-    print('part 1:', part1(lines))
-    print('part 2:', part2(lines))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
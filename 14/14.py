@@ -8,6 +8,11 @@
 
 import sys
 import collections
+import os
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
 
 def efficient(start, rules, iterations):
     '''Keep track of each pair of letters and their counts. Update the pair
@@ -75,21 +80,22 @@ def part2(start, rules):
     '''Run for 40 iterations.'''
     return efficient(start, rules, 40)
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
+    '''Parse the starting polymer and the pair insertion rules.'''
     with open(file) as f:
         lines = list(map(str.strip, f))
 
-    # parse the input
     start = lines[0]
     f = lambda l: l.split(' -> ')
     rules = dict(map(f, lines[2:]))
     assert len(rules) + 2 == len(lines)
 
-    print('part 1:', part1(start, rules))
-    print('part 2:', part2(start, rules))
+    return start, rules
+
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
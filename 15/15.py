@@ -4,37 +4,51 @@
 # Author: Greg Hamerly
 
 import heapq
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc.grid import Grid
+
 def dijkstra(cave):
     '''Use Dijkstra's algorithm to find the shortest path from the top left of
     the "cave" to the bottom right, where the cost ("risk") of each step is the
     value of the cell being entered. For some reason, entering the starting cell
     costs 0 (according to the problem statement).'''
 
-    rows = len(cave)
-    cols = len(cave[0])
+    # the cave is padded with cells of cost -1, which are never entered
+    cells = cave.cells
+    offsets = cave.offsets4
+    goal = cave.index(cave.rows - 1, cave.cols - 1)
 
-    # (row, col): min-cost
-    cost = {(i, j): 1e100 for i in range(rows) for j in range(cols)}
-    cost[(0, 0)] = 0
-    # We could make lookups into "cost" (and the overall algorithm)
-    # significantly faster by combining each coordinate pair (i, j) into a
-    # single index, e.g. (i * cols + j), but that makes the code more confusing.
+    # cell index: min-cost
+    cost = [1e100] * len(cells)
+    start = cave.index(0, 0)
+    cost[start] = 0
 
-    # min-heap: (cost, row, col)
-    frontier = [(0, 0, 0)]
+    # min-heap: (cost, cell index)
+    frontier = [(0, start)]
 
     while frontier:
-        c, i, j = heapq.heappop(frontier)
-        for ii, jj in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]:
-            if 0 <= ii < rows and 0 <= jj < cols:
-                cc = c + cave[ii][jj]
-                if cc < cost[(ii, jj)]:
-                    cost[(ii, jj)] = cc
-                    heapq.heappush(frontier, (cc, ii, jj))
-
-    return cost[(rows-1, cols-1)]
+        c, i = heapq.heappop(frontier)
+        if i == goal:
+            break
+        if c > cost[i]:
+            # a stale entry; i was already reached more cheaply
+            continue
+        for o in offsets:
+            ii = i + o
+            risk = cells[ii]
+            if risk < 0:
+                continue
+            cc = c + risk
+            if cc < cost[ii]:
+                cost[ii] = cc
+                heapq.heappush(frontier, (cc, ii))
+
+    return cost[goal]
 
 def part1(cave):
     '''Just find the shortest path from the top left to the bottom right.'''
@@ -47,29 +61,22 @@ def part2(cave):
     two add 2, etc.). Wrap cell value x > 9 back around to (x % 10) + 1.  Then
     find the shortest path in that cave from the top left to the bottom
     right.'''
-    rows = len(cave)
-    cols = len(cave[0])
+    cave_5x5 = []
+    for io in range(5):
+        for r in range(cave.rows):
+            row = cave.row(r)
+            cave_5x5.append([(v + io + jo - 1) % 9 + 1 for jo in range(5) for v in row])
 
-    cave_5x5 = [[None] * cols * 5 for _ in range(rows * 5)]
-    for i in range(rows * 5):
-        ii, io = i % rows, i // rows
-        for j in range(cols * 5):
-            jj, jo = j % cols, j // cols
-            cave_5x5[i][j] = (cave[ii][jj] + io + jo - 1) % 9 + 1
+    return dijkstra(Grid.from_rows(cave_5x5, pad=1, border=-1))
 
-    return dijkstra(cave_5x5)
+def read_input(file):
+    with open(file) as f:
+        return Grid.from_lines(f, pad=1, border=-1)
 
 def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
+    file = aoc.input_file(__file__)
     print(f'using input: {file}')
-    with open(file) as f:
-        lines = list(map(str.strip, f))
-
-    cave = [list(map(int, line)) for line in lines]
-
-    print('part 1:', part1(cave))
-    print('part 2:', part2(cave))
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
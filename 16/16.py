@@ -3,8 +3,13 @@
 # https://adventofcode.com/2021/day/16 - "packet decoder"
 # Author: Greg Hamerly
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+
 # Class hierarchy:
 #   Packet
 #       +- Literal
@@ -155,21 +160,36 @@ def parse_packets(bits, pos, packets):
 def parse_hex(hexstring):
     return ''.join(f'{int(h, 16):04b}' for h in hexstring)
 
+def parse_line(line):
+    '''Parse one hex transmission into its list of packets.'''
+    bits = parse_hex(line)
+    #print(f'bits = {bits} ({len(bits)})')
+    packets = []
+    parse_packets(bits, 0, packets)
+    #print(packets)
+    return packets
+
+def read_input(file):
+    '''The puzzle input is a single transmission (the sample files hold one
+    transmission per line, which main() handles).'''
+    with open(file) as f:
+        return parse_line(f.readline().strip())
+
 def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
+    file = aoc.input_file(__file__)
     print(f'using input: {file}')
     with open(file) as f:
         lines = list(map(str.strip, f))
 
+    if len(lines) == 1:
+        aoc.run(__file__, file, read_input, part1, part2)
+        return
+
+    # the sample files hold several transmissions; just solve each one
     for i, line in enumerate(lines):
         print('-' * 30, i)
         print(line)
-        bits = ''.join(f'{int(h, 16):04b}' for h in line)
-        #print(f'bits = {bits} ({len(bits)})')
-        packets = []
-        parse_packets(bits, 0, packets)
-        #print(packets)
+        packets = parse_line(line)
 
         print('part 1:', part1(packets))
         print('part 2:', part2(packets))
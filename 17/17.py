@@ -10,8 +10,13 @@
 #     positive/negative values)
 #   - derive closed-form solutions, or at least binary search
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+
 def part1(xrange, yrange):
     '''Search over y velocities; for each velocity, determine if there is some x
     velocity that can hit the target. Take the maximum y velocity that works,
@@ -87,19 +92,19 @@ def part2(xrange, yrange):
     # us.
     return sum(can_hit(xv, yv) for xv in range(500) for yv in range(-350, 500))
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
+    '''Parse the x and y ranges of the target area.'''
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        tokens = f.readline().split()
 
-    tokens = lines[0].split()
     xrange = list(map(int, tokens[2][2:-1].split('..')))
     yrange = list(map(int, tokens[3][2:].split('..')))
+    return xrange, yrange
 
-    print('part 1:', part1(xrange, yrange))
-    print('part 2:', part2(xrange, yrange))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
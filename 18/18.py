@@ -11,6 +11,12 @@
 
 import sys
 import json
+import os
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import instrument
 
 class Tree:
     def __init__(self, left, right):
@@ -56,6 +62,7 @@ class Tree:
         add the given value to that leaf.'''
         self.children[direction].add_to_extreme_leaf(direction, value)
 
+    @instrument.timed()
     def reduce_explode(self, depth=0):
         '''Reduce through exploding. Return something that evaluates to True or
         False, indicating success (or not). Use the return value to communicate
@@ -176,15 +183,14 @@ def part2(lines):
 
     return max(magnitudes)
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return list(map(str.strip, f))
 
-    print('part 1:', part1(lines))
-    print('part 2:', part2(lines))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
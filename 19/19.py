@@ -3,8 +3,14 @@
 # https://adventofcode.com/2021/day/19 - "beacon scanner"
 # Author: Greg Hamerly
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import instrument
+
 class Point:
     def __init__(self, x, y, z):
         self.coords = (x, y, z)
@@ -100,6 +106,7 @@ class Scanner:
     def __repr__(self):
         return f'{len(self.beacons)}: {self.beacons}'
 
+    @instrument.timed()
     def find_mapping(self, other):
         '''Try to match each beacon with each other beacon. Use that as an
         offset, and see if applying that offset to each beacon leads to a
@@ -182,20 +189,21 @@ def parse(lines):
 
     return scanners
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
+    '''Parse the scanners and merge them; both parts work from the merged
+    beacons and scanner positions (so this is where most of the time goes).'''
     with open(file) as f:
         lines = list(map(str.strip, f))
 
     scanner_data = parse(lines)
     rotations = gen_rotations()
 
-    beacons, scanner_positions = merge_scanners(scanner_data, rotations)
+    return merge_scanners(scanner_data, rotations)
 
-    print('part 1:', part1(beacons, scanner_positions))
-    print('part 2:', part2(beacons, scanner_positions))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
@@ -13,50 +13,59 @@
 # iteration, so I can keep track of those bounds and know where "infinity"
 # begins -- and use an "infinite" bit to represent beyond that.
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc.grid import Grid
+
+# translation table for the characters of the image
+BITS = bytes.maketrans(b'.#', b'\x00\x01')
+
 class Image:
     '''An image holds bits that are turned on, plus whether the bits that are
-    infinitely far away are turned on. It also keeps track of the bounds, which
-    grow by 1 row/col each time we augment the image.'''
+    infinitely far away are turned on. The bits are kept in a Grid which is
+    padded with two rings of the infinite bit; the grid grows by 1 row/col in
+    each direction each time we augment the image.'''
 
-    def __init__(self, lines=None, infinite=False):
+    def __init__(self, lines=None, infinite=False, grid=None):
         '''Parse the given sequence of lines (list of strings) and build the
-        initial image; also take on the value of the infinite bit.'''
-        lines = lines or []
-        self.image = set()
-        for r, line in enumerate(lines):
-            for c, char in enumerate(line):
-                if char == '#':
-                    self.image.add((r, c))
-
+        initial image (or take the given grid); also take on the value of the
+        infinite bit.'''
         # infinite represents the value of bits that are outside the image
-        # bounds
         self.infinite = infinite
+        if grid is None:
+            grid = Grid.from_lines(lines or [], pad=2, border=int(infinite), table=BITS)
+        self.grid = grid
 
-        # bounds keeps track of the extents of the image
-        self.bounds = [0, 0, 0, 0]
-        if lines:
-            self.bounds = [0, len(lines), 0, len(lines[0])]
+        # how many times the image has grown, to keep the coordinates of the
+        # original image when displaying
+        self.steps = 0
+
+    def count(self):
+        '''The number of bits turned on (within the image).'''
+        return self.grid.count(1)
 
     def get_bit(self, r, c):
-        '''Get the value of the bit at (r,c). If that is outside the range we
-        care about, then return the infinite bit.'''
-        rmin, rmax, cmin, cmax = self.bounds
-        if rmin <= r <= rmax and cmin <= c <= cmax:
-            return (r, c) in self.image
-        return self.infinite
+        '''Get the value of the bit at (r,c) (in the grid's coordinates). If
+        that is outside the grid, then return the infinite bit.'''
+        if 0 <= r < self.grid.rows and 0 <= c < self.grid.cols:
+            return self.grid[self.grid.index(r, c)]
+        return int(self.infinite)
 
     def display(self):
         '''Render the current image as a grid, plus a little on each side. Also
         add row/column numbers (mod 10) to help compare images.'''
         out = []
         bit = lambda r, c: '.#'[self.get_bit(r, c)]
-        rmin, rmax, cmin, cmax = self.bounds
-        print('  ' + ''.join(f'{c%10}' for c in range(cmin-3, cmax+4)))
-        for r in range(rmin-3, rmax+4):
-            n = f'{r%10:<2}'
-            out.append(n + ''.join(bit(r,c) for c in range(cmin-3, cmax+4)))
+        s = self.steps
+        rows, cols = self.grid.rows, self.grid.cols
+        print('  ' + ''.join(f'{(c-s)%10}' for c in range(-3, cols+3)))
+        for r in range(-3, rows+3):
+            n = f'{(r-s)%10:<2}'
+            out.append(n + ''.join(bit(r,c) for c in range(-3, cols+3)))
         print('\n'.join(out))
 
     def apply(self, program):
@@ -64,22 +73,29 @@ class Image:
 
         # the next Image has infinite = True if infinite is currently false, and
         # program[0] == '#'
-        new_image = Image(infinite=(not self.infinite) and (program[0] == '#'))
-
-        rmin, rmax, cmin, cmax = self.bounds
+        infinite = (not self.infinite) and (program[0] == '#')
 
         # grow by one row/col in each direction
-        new_image.bounds = [rmin - 1, rmax + 1, cmin - 1, cmax + 1]
-
-        for r in range(rmin - 1, rmax + 2):
-            for c in range(cmin - 1, cmax + 2):
-                index = 0
-                for rr in range(r-1,r+2):
-                    for cc in range(c-1,c+2):
-                        index = (index << 1) | self.get_bit(rr, cc)
-                if program[index] == '#':
-                    new_image.image.add((r,c))
-
+        old = self.grid
+        new = Grid(old.rows + 2, old.cols + 2, pad=2, border=int(infinite))
+        program = [int(p == '#') for p in program]
+        cells = old.cells
+        s = old.stride
+
+        for r in range(new.rows):
+            # the 3x3 neighbourhood of new (r, c) is centered on old
+            # (r - 1, c - 1); slide it along the row one column at a time,
+            # keeping the 9-bit index, whose bits are in row-major order
+            top = old.index(r - 2, -3)
+            index = 0
+            for c in range(-2, new.cols):
+                top += 1
+                index = ((index << 1) & 0o666) | (cells[top] << 6) | (cells[top + s] << 3) | cells[top + 2*s]
+                if c >= 0:
+                    new[new.index(r, c)] = program[index]
+
+        new_image = Image(infinite=infinite, grid=new)
+        new_image.steps = self.steps + 1
         return new_image
 
 def iterate_program(program, image, num_iters, display=False):
@@ -87,16 +103,16 @@ def iterate_program(program, image, num_iters, display=False):
     each step.'''
     for i in range(num_iters):
         if display:
-            print('-' * 10, i, image.infinite, len(image.image))
+            print('-' * 10, i, image.infinite, image.count())
             image.display()
         image = image.apply(program)
 
     if display:
         print('final')
-        print('-' * 10, i, image.infinite, len(image.image))
+        print('-' * 10, i, image.infinite, image.count())
         image.display()
 
-    return len(image.image)
+    return image.count()
 
 
 def part1(program, image):
@@ -107,10 +123,8 @@ def part2(program, image):
     '''How many bits are turned on after 50 iterations?'''
     return iterate_program(program, image, 50, False)
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
+    '''Parse the enhancement program and the initial image.'''
     with open(file) as f:
         lines = list(map(str.strip, f))
 
@@ -122,8 +136,12 @@ def main():
     # (infinity), so assert that's not the case.
     assert program[0] == '.' or program[-1] == '.'
 
-    print('part 1:', part1(program, image))
-    print('part 2:', part2(program, image))
+    return program, image
+
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
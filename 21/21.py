@@ -3,8 +3,13 @@
 # https://adventofcode.com/2021/day/21 - "dirac dice"
 # Author: Greg Hamerly
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+
 def part1(lines):
     '''Repeatedly roll a deterministic 100-sided die, following the rules of
        the game. Each player starts from some position, rolls thrice, moves
@@ -106,13 +111,12 @@ def part2(lines):
     play(positions, [0, 0], wins, 0, {})
     return max(wins)
 
-if __name__ == '__main__':
-    fname = '21.in'
-    if len(sys.argv) > 1:
-        fname = sys.argv[1]
+def read_input(file):
+    with open(file) as f:
+        return list(map(str.strip, f))
 
-    with open(fname) as f:
-        lines = list(map(str.strip, f))
+def main():
+    aoc.run(__file__, aoc.input_file(__file__), read_input, part1, part2)
 
-    print('part1:', part1(lines))
-    print('part2:', part2(lines))
+if __name__ == '__main__':
+    main()
@@ -12,8 +12,15 @@
 # Also, everywhere it says "cube", it should really say "cuboid."
 
 import collections
+import functools
 import sys
 import re
+import os
+
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import instrument
 
 def overlapping_range(alow, ahigh, blow, bhigh):
     '''Return true if the two ranges overlap. Touching is
@@ -91,6 +98,7 @@ class Cube:
 
         return Cube(xrange, yrange, zrange)
 
+    @instrument.timed()
     def intersect(self, other):
         '''Iteratively yield the 27 sub-cubes for intersecting self with
         other.'''
@@ -160,9 +168,11 @@ class Cube:
                 for z in range(self.zrange[0], self.zrange[1] + 1):
                     yield xy + z
 
-# for parsing
-rp='-?[0-9]+[.][.]-?[0-9]+'
-pattern = re.compile(f'^(?P<cmd>(on|off)) x=(?P<xr>{rp}),y=(?P<yr>{rp}),z=(?P<zr>{rp})$')
+@functools.lru_cache(maxsize=None)
+def line_pattern():
+    '''The regular expression for parsing a line (compiled on first use).'''
+    rp='-?[0-9]+[.][.]-?[0-9]+'
+    return re.compile(f'^(?P<cmd>(on|off)) x=(?P<xr>{rp}),y=(?P<yr>{rp}),z=(?P<zr>{rp})$')
 
 def part1(cubes):
     cubes = [c for c in cubes if c[1].part1_range()]
@@ -183,7 +193,8 @@ def any_intersect(cubes):
                 return True
     return False
 
-REDUCE_CUBES = 'noreduce' not in sys.argv
+# turned off by giving "noreduce" on the command line (see main())
+REDUCE_CUBES = True
 
 # FIXME -- this doesn't work
 # The main idea is to only try to join cubes whose faces match by hashing their
@@ -307,10 +318,8 @@ def part2(cubes):
     cubes = cubes[first_on:]
     on_cubes = [cubes[0][1]]
 
-    cube_num = 2
     for new_cmd, new_cube in cubes[1:]:
-        print(cube_num, '/', len(cubes), '-' * 10)
-        cube_num += 1
+        instrument.count('part2 cubes')
 
         if not new_cmd:
             # turn off lights
@@ -327,10 +336,6 @@ def part2(cubes):
 
             on_cubes.extend(new_cubes)
 
-            print(f'after {new_cmd}, {new_cube}')
-            print(f'on_cubes: {len(on_cubes)}')
-            print(f'current volume: {sum([c.volume() for c in on_cubes])}')
-
         else:
             # turn on lights -- but avoid double counting
 
@@ -383,10 +388,6 @@ def part2(cubes):
 
             on_cubes += frontier
 
-            print(f'after {new_cmd}, {new_cube}')
-            print(f'on_cubes: {len(on_cubes)}')
-            print(f'current volume: {sum([c.volume() for c in on_cubes])}')
-
         # sanity check
         ensure_no_overlap(on_cubes)
 
@@ -394,7 +395,8 @@ def part2(cubes):
         old_volume = sum([c.volume() for c in on_cubes])
         orig_len = len(on_cubes)
         on_cubes = reduce_cubes(on_cubes)
-        print(f'reduced {orig_len} -> {len(on_cubes)}')
+        instrument.count('part2 on_cubes', orig_len)
+        instrument.count('part2 on_cubes reduced away', orig_len - len(on_cubes))
         new_volume = sum([c.volume() for c in on_cubes])
         assert old_volume == new_volume, (old_volume, new_volume)
 
@@ -411,6 +413,7 @@ def ensure_no_overlap(cubes):
 
 def parse(lines):
     f = lambda r: tuple(map(int, r.split('..')))
+    pattern = line_pattern()
     cubes = []
     for line in lines:
         m = pattern.match(line)
@@ -425,14 +428,19 @@ def parse(lines):
 
     return cubes
 
-if __name__ == '__main__':
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return parse(map(str.strip, f))
+
+def main():
+    global REDUCE_CUBES
+    if 'noreduce' in sys.argv:
+        sys.argv.remove('noreduce')
+        REDUCE_CUBES = False
 
-    cubes = parse(lines)
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
-    print('part1:', part1(cubes))
-    print('part2:', part2(cubes))
+if __name__ == '__main__':
+    main()
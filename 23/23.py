@@ -8,8 +8,14 @@
 # Solving part 1 takes about 5 minutes, part 2 about 20 minutes (both with
 # pypy3).
 
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import instrument
+
 ############# Part 1
 #...........#
 ###B#C#B#D###
@@ -179,6 +185,8 @@ def home_pos(player, positions):
     assert False
 
 def search(players, positions, best, dist):
+    if instrument.ENABLED:
+        instrument.count('search nodes')
     if dist >= best[0]:
         return
 
@@ -266,17 +274,14 @@ GOAL_POSITIONS = None
 NEIGHBORS = None
 HOME_POSITIONS = None
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return parse(list(map(str.strip, f)))
 
-    positions_part1 = parse(lines)
-
-    print('part 1:', part1(positions_part1))
-    print('part 2:', part2(positions_part1))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
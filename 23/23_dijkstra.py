@@ -9,9 +9,16 @@
 # enough by adding better bounds or exploiting properties of the problem (e.g.
 # max 2 moves per piece).
 
+import functools
 import heapq
+import os
 import sys
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import instrument
+
 #############
 #...........#
 ###B#C#B#D###
@@ -68,11 +75,6 @@ FIRST_MOVES = (0, 1, 3, 5, 7, 9, 10)
 # these are the second moves that are possible, sorted by player (0...3)
 SECOND_MOVES = {i: (11 + i, 15 + i) for i in range(4)}
 
-print('GOAL_POSITIONS', GOAL_POSITIONS)
-print('NEIGHBORS', NEIGHBORS)
-print('FIRST_MOVES', FIRST_MOVES)
-print('SECOND_MOVES', SECOND_MOVES)
-
 class GameState:
     def __init__(self, positions=[], cost=0):
         self.encoding = self.encode(positions)
@@ -104,7 +106,7 @@ class GameState:
 
     def is_goal(self):
         #return self.positions == GOAL_POSITIONS
-        return self.encoding == GOAL_ENCODING
+        return self.encoding == goal_encoding()
 
     def search(self, positions, position, destinations, seen=None, length=0):
         seen = seen or set()
@@ -255,7 +257,10 @@ class GameState:
 
         return GameState(positions)
 
-GOAL_ENCODING = GameState.encode(GOAL_POSITIONS)
+@functools.lru_cache(maxsize=None)
+def goal_encoding():
+    '''The encoding of GOAL_POSITIONS (computed on first use).'''
+    return GameState.encode(GOAL_POSITIONS)
 
 def part1(s):
     frontier = [s]
@@ -264,14 +269,11 @@ def part1(s):
 
     oo = 1e100
 
-    i = 0
     while frontier:
-        i += 1
         s = heapq.heappop(frontier)
-
-        if i % 1000 == 0:
-            print(i, len(frontier))
-            s.display()
+        if instrument.ENABLED:
+            instrument.count('part1 expansions')
+            instrument.count('part1 frontier size', len(frontier))
 
         for neighbor in s.neighbors():
             if neighbor.cost <= cost.get(neighbor, oo):
@@ -287,17 +289,19 @@ def part1(s):
 def part2(lines):
     pass
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return GameState.parse(list(map(str.strip, f)))
 
-    s = GameState.parse(lines)
+def main():
+    print('GOAL_POSITIONS', GOAL_POSITIONS)
+    print('NEIGHBORS', NEIGHBORS)
+    print('FIRST_MOVES', FIRST_MOVES)
+    print('SECOND_MOVES', SECOND_MOVES)
 
-    print('part 1:', part1(s))
-    print('part 2:', part2(lines))
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
@@ -21,9 +21,15 @@
 #   - instead of generating all possible values, just check that 0 is able to
 #     be produced
 
+import os
 import sys
 import time
 
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc import instrument
+
 class BaseExpression:
     def __init__(self):
         super().__init__()
@@ -281,27 +287,17 @@ def mul(state, a, b):
     else:
         state[a] = MulOp(state[a], b)
 
-COUNT = 0
-
 SEARCH_ORDER_PART1 = [9, 8, 7, 6, 5, 4, 3, 2, 1]
 SEARCH_ORDER_PART2 = [1, 2, 3, 4, 5, 6, 7, 8, 9]
 SEARCH_ORDER = None
 
+@instrument.timed()
 def search(expression, var_ndx):
-    global COUNT, SEARCH_ORDER
-    print('search', var_ndx)
     if var_ndx == len(VARIABLES):
         return True
 
-    COUNT += 1
-    if COUNT % 50 == 0:
-        v = []
-        for var in VARIABLES:
-            if len(var.values) == 1:
-                v.append(var.values[0])
-            else:
-                v.append('?')
-        print(COUNT, ''.join(map(str, v)))
+    if instrument.ENABLED:
+        instrument.count('search nodes')
 
     for v in SEARCH_ORDER:
         VARIABLES[var_ndx].set_values([v])
@@ -315,6 +311,9 @@ def search(expression, var_ndx):
     VARIABLES[var_ndx].set_values(list(range(1, 10)))
 
 def parse_alu(lines):
+    # each inp instruction creates a new variable; start from none
+    VARIABLES.clear()
+
     state = {'w': Constant(0), 'x': Constant(0), 'y': Constant(0), 'z': Constant(0)}
 
     ops = { name: globals()[name] for name in ['add', 'div', 'eql', 'inp', 'mod', 'mul'] }
@@ -380,17 +379,14 @@ def part2(expression):
 
     return ans
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
     with open(file) as f:
-        lines = list(map(str.strip, f))
-
-    expression = parse_alu(lines)
+        return parse_alu(list(map(str.strip, f)))
 
-    print('part 1:', part1(expression))
-    print('part 2:', part2(expression))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1, part2)
 
 if __name__ == '__main__':
     main()
@@ -3,66 +3,59 @@
 # https://adventofcode.com/2021/day/25 - "sea cucumber"
 # Author: Greg Hamerly
 
+import os
 import sys
 
-def part1(seafloor, height, width):
+# the shared tooling (aoc/) lives at the top of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aoc
+from aoc.grid import Grid
+
+EMPTY, EAST, SOUTH = 0, 1, 2
+
+# translation table for the characters of the map
+HERDS = bytes.maketrans(b'.>v', bytes([EMPTY, EAST, SOUTH]))
+
+def part1(seafloor):
+    seafloor = seafloor.copy()
+    cells = seafloor.cells
+    height, width = seafloor.rows, seafloor.cols
+
+    # the index of the cell to the east / south of each cell, wrapping around
+    east = [r * width + (c + 1) % width for r in range(height) for c in range(width)]
+    south = [((r + 1) % height) * width + c for r in range(height) for c in range(width)]
+
     num_iterations = 0
     moved = True
     while moved:
         moved = False
-        sf_next = {}
 
        # display the state
        #print(num_iterations)
-       #for i in range(height):
-       #    row = [seafloor.get((i, j), '.') for j in range(width)]
-       #    print(''.join(row))
-
-        # east
-        for (i, j), direction in seafloor.items():
-            if direction == 'v':
-                continue
-
-            jj = (j + 1) % width
-            if (i, jj) in seafloor:
-                sf_next[(i, j)] = '>'
-            else:
-                sf_next[(i, jj)] = '>'
-                moved = True
+       #print(str(seafloor).translate(str.maketrans('012', '.>v')))
 
-        # south
-        for (i, j), direction in seafloor.items():
-            if direction == '>':
-                continue
-
-            ii = (i + 1) % height
-            if seafloor.get((ii, j), '') == 'v' or (ii, j) in sf_next:
-                sf_next[(i, j)] = 'v'
-            else:
-                sf_next[(ii, j)] = 'v'
-                moved = True
+        # each herd moves all at once, so first find all those that can move,
+        # then move them
+        for herd, dest in ((EAST, east), (SOUTH, south)):
+            movers = [i for i, d in enumerate(dest) if cells[i] == herd and cells[d] == EMPTY]
+            for i in movers:
+                cells[i] = EMPTY
+                cells[dest[i]] = herd
+            moved = moved or bool(movers)
 
         num_iterations += 1
-        seafloor = sf_next
 
     return num_iterations
 
-def main():
-    regular_input = __file__.split('/')[-1][:-len('.py')] + '.in'
-    file = regular_input if len(sys.argv) <= 1 else sys.argv[1]
-    print(f'using input: {file}')
+def read_input(file):
+    '''Parse the map into a Grid of the herds (EMPTY, EAST or SOUTH).'''
     with open(file) as f:
-        lines = list(map(str.strip, f))
+        return Grid.from_lines(f, table=HERDS)
 
-    seafloor = {}
-    height, width = len(lines), len(lines[0])
-    for i, line in enumerate(lines):
-        for j, c in enumerate(line):
-            if c == '.':
-                continue
-            seafloor[(i,j)] = c
-
-    print('part 1:', part1(seafloor, height, width))
+def main():
+    file = aoc.input_file(__file__)
+    print(f'using input: {file}')
+    aoc.run(__file__, file, read_input, part1)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,65 @@
+'''Shared tooling for running, timing and checking the daily solutions.
+
+Each day lives in its own directory (01/ ... 25/) as a standalone script with
+part1() and part2() functions, plus read_input(file) which parses an input file
+into the arguments those functions take.'''
+
+import os
+import sys
+
+def input_file(script):
+    '''The input file named on the command line (the first argument that is not
+    a --flag), or else the day's puzzle input (e.g. "4.in" for 4.py).'''
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    return args[0] if args else os.path.basename(script)[:-len('.py')] + '.in'
+
+def open_input(file):
+    '''Open the input file for reading; "-" is stdin.'''
+    if file == '-':
+        import contextlib
+        return contextlib.nullcontext(sys.stdin)
+    return open(file)
+
+def run(script, file, read_input, *parts, stream=None):
+    '''Print the answer of each part (part1, part2, ...) for the given input
+    file. Answers are taken from the cache when possible (see aoc.cache), and
+    read_input is only called if some part has to be computed. A tuple returned
+    by read_input is passed to the parts as several arguments.
+
+    A day whose parts can work in one pass over any iterator may give stream, a
+    function from an open file to an iterator over the parsed input. Then if the
+    file is "-" (stdin) or --stream is on the command line, the input is read
+    once and fed to all the parts together (see aoc.stream), without the cache.
+
+    With --memprof (or --memprof-update) on the command line, the cache is
+    bypassed and each part's memory use is reported (see aoc.memprof).'''
+    if stream and (file == '-' or '--stream' in sys.argv):
+        from aoc import stream as streaming
+        with open_input(file) as f:
+            answers = streaming.fan_out(stream(f), *parts)
+        for n, answer in enumerate(answers, 1):
+            print(f'part {n}:', answer)
+        return
+
+    from aoc import cache
+
+    memprof = None
+    if '--memprof' in sys.argv or '--memprof-update' in sys.argv:
+        from aoc import memprof
+
+    args = None
+    for n, part in enumerate(parts, 1):
+        use_cache = cache.enabled() and not memprof and file != '-'
+        k = cache.key(script, n, file) if use_cache else None
+        hit, answer = cache.get(k) if k else (False, None)
+        if not hit:
+            if args is None:
+                args = read_input(file)
+                args = args if isinstance(args, tuple) else (args,)
+            if memprof:
+                answer = memprof.run_part(script, n, part, args)
+            else:
+                answer = part(*args)
+            if k:
+                cache.put(k, answer, script=os.path.basename(script), part=n)
+        print(f'part {n}:', answer)
@@ -0,0 +1,130 @@
+'''Benchmark the daily solutions.
+
+Each day's module is imported, and its input file is parsed (read_input) and
+every part is run a few times for warmup, and then repeatedly to collect
+wall-clock timings. Parsing is reported as its own entry ("parse"), since some
+days (e.g. day 19) do much of their work there. Each part is given a fresh copy
+of the parsed input for every run, so a part that modifies its input does not
+affect the next run. The statistics (min, median, p95) are printed, and
+optionally written to a JSON file, which a later run can be compared against to
+find regressions.
+
+    python3 -m aoc.bench                      # all days
+    python3 -m aoc.bench 15 19-22 --repeat 10 --output bench.json
+    python3 -m aoc.bench --compare bench.json # flag parts that got slower
+'''
+
+import argparse
+import contextlib
+import copy
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from aoc import days
+
+def percentile(samples, p):
+    '''Nearest-rank percentile of the samples (p in [0, 100]).'''
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+def summarize(samples):
+    return {
+            'runs': len(samples),
+            'min': min(samples),
+            'median': statistics.median(samples),
+            'p95': percentile(samples, 95),
+            }
+
+def time_runs(f, make_args, warmup, repeat, budget):
+    '''Call f(*make_args()) warmup times untimed, then up to repeat times
+    timed. Stop early once the timed runs have used up the time budget
+    (seconds), but always time at least one run. The arguments are made afresh
+    for every run, outside of the timing.'''
+    for _ in range(warmup):
+        f(*make_args())
+
+    samples = []
+    answer = None
+    spent = 0
+    while len(samples) < repeat and (not samples or spent < budget):
+        args = make_args()
+        start = time.perf_counter()
+        answer = f(*args)
+        samples.append(time.perf_counter() - start)
+        spent += samples[-1]
+    return answer, samples
+
+def bench_day(day, warmup, repeat, budget, input_name=None):
+    '''Benchmark one day; return {'parse': {...}, 'part1': {...}, 'part2':
+    {...}}.'''
+    module = days.load_module(day)
+    file = days.input_path(day, input_name)
+    results = {}
+
+    # the solutions print progress as they go; keep that out of the report
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        args, samples = time_runs(days.read_args, lambda: (module, file), warmup, repeat, budget)
+        results['parse'] = summarize(samples)
+        for part, f in days.parts(module):
+            answer, samples = time_runs(f, lambda: copy.deepcopy(args), warmup, repeat, budget)
+            results[f'part{part}'] = dict(summarize(samples), answer=str(answer))
+
+    return results
+
+def compare(current, baseline, threshold):
+    '''Return a list of (day, part, old median, new median) for parts whose
+    median got slower by more than the threshold fraction.'''
+    regressions = []
+    for day, parts in current.items():
+        for part, stats in parts.items():
+            old = baseline.get(day, {}).get(part)
+            if old and stats['median'] > old['median'] * (1 + threshold):
+                regressions.append((day, part, old['median'], stats['median']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 15 or 19-22 (default: all)')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs per part')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per part')
+    parser.add_argument('--budget', type=float, default=30,
+            help='stop repeating a part after this many seconds')
+    parser.add_argument('--input', help='input file name within each day directory')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare against the results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+            help='slowdown fraction that counts as a regression')
+    args = parser.parse_args()
+
+    results = {}
+    for day in days.parse_days(args.days):
+        parts = bench_day(day, args.warmup, args.repeat, args.budget, args.input)
+        results[str(day)] = parts
+        for part, s in parts.items():
+            print(f'day {day:2} {part}: min {s["min"]:10.6f}  median {s["median"]:10.6f}'
+                  f'  p95 {s["p95"]:10.6f}  ({s["runs"]} runs)', flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'machine': platform.machine(),
+                       'timestamp': time.time(),
+                       'days': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['days']
+        regressions = compare(results, baseline, args.threshold)
+        for day, part, old, new in regressions:
+            print(f'REGRESSION day {day} {part}: median {old:.6f} -> {new:.6f}')
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
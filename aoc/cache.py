@@ -0,0 +1,103 @@
+'''A persistent cache of answers on disk.
+
+An answer is keyed by the day's script, the part, the SHA-256 of the input file
+and the SHA-256 of the script's source and of the sources of the aoc package
+(which the scripts share, e.g. aoc.grid and aoc.numeric), so it is recomputed
+whenever the code or the data changes. Each entry is a small JSON file in the
+cache directory (AOC_CACHE_DIR, by default .aoc_cache/ at the top of the
+repository). When the directory grows past AOC_CACHE_MAX_BYTES, the least
+recently used entries are removed.
+
+The cache is bypassed if AOC_NO_CACHE is set in the environment, or if
+--no-cache is given on the command line.'''
+
+import functools
+import glob
+import hashlib
+import json
+import os
+import sys
+
+from aoc.days import ROOT
+
+CACHE_DIR = os.environ.get('AOC_CACHE_DIR', os.path.join(ROOT, '.aoc_cache'))
+MAX_BYTES = int(os.environ.get('AOC_CACHE_MAX_BYTES', 1 << 20))
+
+def enabled():
+    return not os.environ.get('AOC_NO_CACHE') and '--no-cache' not in sys.argv
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def package_hash():
+    '''The SHA-256 of the sources of the aoc package.'''
+    package = os.path.dirname(os.path.abspath(__file__))
+    sources = sorted(glob.glob(os.path.join(package, '**', '*.py'), recursive=True))
+    h = hashlib.sha256()
+    for path in sources:
+        h.update(os.path.relpath(path, package).encode())
+        h.update(file_hash(path).encode())
+    return h.hexdigest()
+
+def key(script, part, input_file):
+    '''The cache key of one part of a day's script on the given input.'''
+    name = os.path.basename(script)
+    parts = [name, str(part), file_hash(input_file), file_hash(script), package_hash()]
+    return hashlib.sha256(':'.join(parts).encode()).hexdigest()
+
+def _path(k):
+    return os.path.join(CACHE_DIR, k + '.json')
+
+def get(k):
+    '''Return (True, answer) if the key is cached, else (False, None).'''
+    try:
+        with open(_path(k)) as f:
+            answer = json.load(f)['answer']
+    except (OSError, ValueError, KeyError):
+        return False, None
+    # mark the entry as recently used (unless another process just evicted it)
+    try:
+        os.utime(_path(k))
+    except OSError:
+        pass
+    return True, answer
+
+def put(k, answer, **info):
+    '''Store the answer (if it can be stored as JSON), along with any extra
+    information that helps identify the entry.'''
+    if not isinstance(answer, (int, float, str)):
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = _path(k) + f'.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(dict(info, answer=answer), f)
+    os.replace(tmp, _path(k))
+    evict()
+
+def evict(max_bytes=MAX_BYTES):
+    '''Remove the least recently used entries until the cache fits in
+    max_bytes.'''
+    entries = []
+    with os.scandir(CACHE_DIR) as it:
+        for e in it:
+            if e.name.endswith('.json'):
+                st = e.stat()
+                entries.append((st.st_mtime, st.st_size, e.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+
+def clear():
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith('.json'):
+                os.remove(os.path.join(CACHE_DIR, name))
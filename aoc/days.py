@@ -0,0 +1,52 @@
+'''Locate and import the per-day solution scripts.
+
+The scripts are named after the day (01/1.py, ..., 25/25.py), which are not
+valid module names, so they are imported by path.'''
+
+import importlib.util
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = tuple(range(1, 26))
+
+def day_dir(day):
+    return os.path.join(ROOT, f'{day:02}')
+
+def script_path(day, variant=''):
+    '''The path of the day's script; variant selects an alternative solution
+    (e.g. '_dijkstra' for 23/23_dijkstra.py).'''
+    return os.path.join(day_dir(day), f'{day}{variant}.py')
+
+def input_path(day, name=None):
+    '''The path of an input file for the day (by default the puzzle input).'''
+    return os.path.join(day_dir(day), name or f'{day}.in')
+
+def load_module(day, variant=''):
+    '''Import the day's script as a module named e.g. "day01".'''
+    spec = importlib.util.spec_from_file_location(f'day{day:02}{variant}',
+                                                  script_path(day, variant))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def read_args(module, file):
+    '''Parse the input file with the module's read_input(), and return the
+    result as a tuple of arguments for part1/part2. A read_input() that returns
+    a tuple provides several arguments; anything else is a single argument.'''
+    args = module.read_input(file)
+    return args if isinstance(args, tuple) else (args,)
+
+def parts(module):
+    '''Return [(1, part1), (2, part2)] for the parts the module defines (day 25
+    only has a part 1).'''
+    return [(p, getattr(module, f'part{p}')) for p in (1, 2)
+            if hasattr(module, f'part{p}')]
+
+def parse_days(specs):
+    '''Turn command line day specifications like "15", "19-22" into a sorted
+    list of day numbers; no specifications means every day.'''
+    days = set()
+    for spec in specs:
+        low, _, high = spec.partition('-')
+        days.update(range(int(low), int(high or low) + 1))
+    return sorted(days) if days else list(DAYS)
@@ -0,0 +1,22 @@
+'''Seeded generators of synthetic puzzle inputs, one module per day.
+
+Each module (day01 ... day25) provides generate(size, seed=0), which returns
+the text of a valid input for that day, and SIZES, a sequence of sizes that is
+reasonable for measuring how the solution scales. What "size" means depends on
+the day (e.g. the number of lines for day 1, the side of the cave for day 15,
+the number of scanners for day 19); it is documented in each module. Days whose
+input has no meaningful size have SIZES = None, and ignore the size.'''
+
+import importlib
+
+def generator(day):
+    '''Return the generator module for the given day.'''
+    return importlib.import_module(f'aoc.generators.day{day:02}')
+
+def generate(day, size, seed=0):
+    return generator(day).generate(size, seed)
+
+def write(day, size, path, seed=0):
+    '''Generate an input and write it to the given path.'''
+    with open(path, 'w') as f:
+        f.write(generate(day, size, seed))
@@ -0,0 +1,15 @@
+'''Day 1: size is the number of sonar depths (a random walk that never goes
+above the surface).'''
+
+import random
+
+SIZES = (10000, 30000, 100000, 300000)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    depth = 100
+    depths = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 12))
+        depths.append(depth)
+    return '\n'.join(map(str, depths)) + '\n'
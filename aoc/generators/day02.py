@@ -0,0 +1,10 @@
+'''Day 2: size is the number of submarine commands.'''
+
+import random
+
+SIZES = (10000, 30000, 100000, 300000)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    commands = rng.choices(['forward', 'down', 'up'], weights=[4, 3, 2], k=size)
+    return ''.join(f'{c} {rng.randint(1, 9)}\n' for c in commands)
@@ -0,0 +1,34 @@
+'''Day 3: size is the number of diagnostic rows (rounded up to be odd, so no
+column has a tie).
+
+The rows are unique, and are chosen so that whenever two or more rows share a
+prefix, both bit values follow that prefix. Otherwise the CO2 filter (keep the
+least common bit) could discard every remaining row.'''
+
+import random
+
+SIZES = (1001, 3001, 10001, 30001)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    size |= 1
+    width = max(5, size.bit_length() + 1)
+
+    rows = []
+    def fill(prefix, bits_left, count):
+        '''Choose count unique values below the given prefix.'''
+        if count == 1:
+            rows.append((prefix << bits_left) | rng.getrandbits(bits_left))
+            return
+        # split the count over both children; each child can hold at most
+        # half the values below this prefix
+        half = 1 << (bits_left - 1)
+        low = max(1, count - half)
+        high = min(half, count - 1)
+        zeros = rng.randint(low, high)
+        fill(prefix << 1, bits_left - 1, zeros)
+        fill((prefix << 1) | 1, bits_left - 1, count - zeros)
+
+    fill(0, width, size)
+    rng.shuffle(rows)
+    return ''.join(f'{r:0{width}b}\n' for r in rows)
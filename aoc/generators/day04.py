@@ -0,0 +1,18 @@
+'''Day 4: size is the number of bingo boards. The numbers 0-99 are all called
+(in random order), so every board wins eventually.'''
+
+import random
+
+SIZES = (100, 300, 1000, 3000)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    out = [','.join(map(str, numbers)), '']
+    for _ in range(size):
+        cells = rng.sample(range(100), 25)
+        for r in range(5):
+            out.append(' '.join(f'{n:2}' for n in cells[r*5:r*5+5]))
+        out.append('')
+    return '\n'.join(out)
@@ -0,0 +1,20 @@
+'''Day 5: size is the number of vent lines (horizontal, vertical and diagonal)
+in a 1000x1000 area.'''
+
+import random
+
+SIZES = (300, 1000, 3000, 10000)
+
+def generate(size, seed=0, extent=1000):
+    rng = random.Random(seed)
+    out = []
+    while len(out) < size:
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        if rng.random() < 0.5:
+            dx, dy = -dx, -dy
+        length = rng.randint(1, extent // 2)
+        x2, y2 = x1 + dx * length, y1 + dy * length
+        if 0 <= x2 < extent and 0 <= y2 < extent:
+            out.append(f'{x1},{y1} -> {x2},{y2}\n')
+    return ''.join(out)
@@ -0,0 +1,9 @@
+'''Day 6: size is the number of lanternfish.'''
+
+import random
+
+SIZES = (10000, 100000, 1000000)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return ','.join(str(rng.randint(1, 5)) for _ in range(size)) + '\n'
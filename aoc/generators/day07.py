@@ -0,0 +1,9 @@
+'''Day 7: size is the number of crabs, with positions in [0, 2000).'''
+
+import random
+
+SIZES = (1000, 3000, 10000, 30000)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return ','.join(str(int(rng.expovariate(1 / 400)) % 2000) for _ in range(size)) + '\n'
@@ -0,0 +1,21 @@
+'''Day 8: size is the number of display lines, each with its own random
+wiring.'''
+
+import random
+
+SIZES = (20, 60, 200, 600)
+
+SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf',
+            'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(size):
+        wiring = dict(zip('abcdefg', rng.sample('abcdefg', 7)))
+        def scramble(pattern):
+            return ''.join(rng.sample([wiring[c] for c in pattern], len(pattern)))
+        patterns = [scramble(p) for p in rng.sample(SEGMENTS, 10)]
+        outputs = [scramble(rng.choice(SEGMENTS)) for _ in range(4)]
+        out.append(' '.join(patterns) + ' | ' + ' '.join(outputs) + '\n')
+    return ''.join(out)
@@ -0,0 +1,32 @@
+'''Day 9: size is the side of a square heightmap.
+
+The map is cut into rectangular basins by walls of 9s. Within each basin, the
+height is the distance from a random low point (capped at 8). Each basin then
+has exactly one low point, as the puzzle requires.'''
+
+import random
+
+SIZES = (100, 200, 400, 800)
+
+def cuts(rng, size):
+    '''Random positions of walls, 4-12 cells apart.'''
+    positions = []
+    p = rng.randint(2, 12)
+    while p < size:
+        positions.append(p)
+        p += rng.randint(4, 12)
+    return [-1] + positions + [size]
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    grid = [[9] * size for _ in range(size)]
+    rows, cols = cuts(rng, size), cuts(rng, size)
+    for r0, r1 in zip(rows, rows[1:]):
+        for c0, c1 in zip(cols, cols[1:]):
+            if r0 + 1 >= r1 or c0 + 1 >= c1:
+                continue
+            lr, lc = rng.randrange(r0 + 1, r1), rng.randrange(c0 + 1, c1)
+            for r in range(r0 + 1, r1):
+                for c in range(c0 + 1, c1):
+                    grid[r][c] = min(8, abs(r - lr) + abs(c - lc))
+    return ''.join(''.join(map(str, row)) + '\n' for row in grid)
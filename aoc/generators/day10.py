@@ -0,0 +1,27 @@
+'''Day 10: size is the number of lines of brackets. About half the lines are
+corrupted, and the rest are incomplete.'''
+
+import random
+
+SIZES = (1000, 3000, 10000, 30000)
+
+PAIRS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+def generate(size, seed=0, length=100):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(size):
+        line, stack = [], []
+        while len(line) < length or not stack:
+            if stack and rng.random() < 0.45:
+                line.append(PAIRS[stack.pop()])
+            else:
+                stack.append(rng.choice('([{<'))
+                line.append(stack[-1])
+
+        if rng.random() < 0.5:
+            # corrupt the line with a wrong closing character
+            wrong = [c for c in PAIRS.values() if c != PAIRS[stack[-1]]]
+            line.append(rng.choice(wrong))
+        out.append(''.join(line) + '\n')
+    return ''.join(out)
@@ -0,0 +1,57 @@
+'''Day 11: size is the side of a square grid of octopus energy levels.
+
+Grids of uniformly random levels almost never synchronize, so part 2 would
+only measure its cap of 10000 steps. Levels between 3 and 9 flash in large
+cascades, and usually synchronize within a couple of hundred steps. Grids are
+drawn (from the same seeded generator) until one synchronizes within
+SYNC_STEPS, which is checked by simulating it.'''
+
+import random
+
+SIZES = (10, 20, 40, 80)
+
+# the lowest energy level drawn
+LOWEST = 3
+# a grid must synchronize within this many steps
+SYNC_STEPS = 1000
+
+def synchronizes(levels, size, steps=SYNC_STEPS):
+    '''Return the first step at which all of the octopuses flash, or None if
+    that does not happen within the given number of steps.'''
+    levels = list(levels)
+    neighbors = []
+    for r in range(size):
+        for c in range(size):
+            neighbors.append([rr * size + cc
+                              for rr in range(max(0, r - 1), min(size, r + 2))
+                              for cc in range(max(0, c - 1), min(size, c + 2))
+                              if (rr, cc) != (r, c)])
+
+    for step in range(1, steps + 1):
+        stack = []
+        for i in range(len(levels)):
+            levels[i] += 1
+            if levels[i] == 10:
+                stack.append(i)
+        flashed = len(stack)
+        while stack:
+            for j in neighbors[stack.pop()]:
+                levels[j] += 1
+                if levels[j] == 10:
+                    stack.append(j)
+                    flashed += 1
+        if flashed == len(levels):
+            return step
+        for i in range(len(levels)):
+            if levels[i] > 9:
+                levels[i] = 0
+    return None
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    while True:
+        levels = [rng.randint(LOWEST, 9) for _ in range(size * size)]
+        if synchronizes(levels, size):
+            break
+    return ''.join(''.join(map(str, levels[r * size:(r + 1) * size])) + '\n'
+                   for r in range(size))
@@ -0,0 +1,24 @@
+'''Day 12: size is the number of small caves. Big caves are only ever connected
+to small caves (otherwise there are infinitely many paths). The number of
+paths grows exponentially with the size.'''
+
+import random
+
+SIZES = (4, 6, 8, 10)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    small = [f'{chr(97 + i // 26)}{chr(97 + i % 26)}' for i in range(size)]
+    big = [c.upper() for c in small[:max(1, size // 4)]]
+
+    edges = set()
+    for i, cave in enumerate(small):
+        # connect each small cave to an earlier cave, or to start
+        edges.add((rng.choice(['start'] + small[:i]), cave))
+    for cave in big:
+        for other in rng.sample(small, min(2, size)):
+            edges.add((cave, other))
+    for cave in rng.sample(small, min(2, size)):
+        edges.add((cave, 'end'))
+
+    return ''.join(f'{u}-{v}\n' for u, v in sorted(edges))
@@ -0,0 +1,41 @@
+'''Day 13: size is the number of dots on the transparent paper. The paper is
+folded 12 times (as in the puzzle) down to 40x6.
+
+The dots are made by placing random dots on the final 40x6 paper and
+unfolding; that way no dot ever lies on a fold line.'''
+
+import random
+
+SIZES = (1000, 3000, 10000, 30000)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+
+    # the folds, from last to first, with the dimensions before each fold
+    width, height = 40, 6
+    folds = []
+    for axis in 'yyxyxyxyxyxy':
+        if axis == 'x':
+            folds.append(('x', width))
+            width = 2 * width + 1
+        else:
+            folds.append(('y', height))
+            height = 2 * height + 1
+    folds.reverse()
+
+    # pick the dots on the final paper, then unfold each dot randomly
+    dots = set()
+    while len(dots) < size:
+        x, y = rng.randrange(40), rng.randrange(6)
+        for axis, value in reversed(folds):
+            if rng.random() < 0.5:
+                if axis == 'x':
+                    x = 2 * value - x
+                else:
+                    y = 2 * value - y
+        dots.add((x, y))
+
+    out = [f'{x},{y}' for x, y in dots]
+    out.append('')
+    out.extend(f'fold along {axis}={value}' for axis, value in folds)
+    return '\n'.join(out) + '\n'
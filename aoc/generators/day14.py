@@ -0,0 +1,16 @@
+'''Day 14: size is the length of the polymer template. Insertion rules cover
+every pair of the 10 elements.'''
+
+import random
+
+SIZES = (20, 40, 80, 160)
+
+ELEMENTS = 'BCFHKNOPSV'
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    out = [''.join(rng.choices(ELEMENTS, k=size)), '']
+    for a in ELEMENTS:
+        for b in ELEMENTS:
+            out.append(f'{a}{b} -> {rng.choice(ELEMENTS)}')
+    return '\n'.join(out) + '\n'
@@ -0,0 +1,11 @@
+'''Day 15: size is the side of a square cave of risk levels (part 2 expands it
+to 5 times that).'''
+
+import random
+
+SIZES = (25, 50, 100, 200)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return ''.join(''.join(str(rng.randint(1, 9)) for _ in range(size)) + '\n'
+                   for _ in range(size))
@@ -0,0 +1,55 @@
+'''Day 16: size is (roughly) the number of packets in a single transmission.
+The packets form a random expression tree of bounded depth.'''
+
+import random
+
+SIZES = (100, 300, 1000, 3000)
+
+MAX_DEPTH = 12
+
+def literal(rng, version):
+    value = rng.randrange(256)
+    groups = []
+    while True:
+        groups.append(value & 15)
+        value >>= 4
+        if not value:
+            break
+    groups.reverse()
+    bits = [f'{version:03b}100']
+    for i, g in enumerate(groups):
+        bits.append(f'{int(i + 1 < len(groups))}{g:04b}')
+    return ''.join(bits)
+
+def packet(rng, budget, depth):
+    '''Return the bits of a packet using about budget packets.'''
+    version = rng.randrange(8)
+    if budget <= 1 or depth >= MAX_DEPTH:
+        return literal(rng, version)
+
+    # comparisons take exactly two operands; keep them for small subtrees
+    if budget <= 8 and rng.random() < 0.3:
+        type_id = rng.choice([5, 6, 7])
+        count = 2
+    else:
+        type_id = rng.choice([0, 1, 2, 3])
+        count = rng.randint(1, min(budget - 1, 6))
+
+    # share the budget among the children
+    remaining = budget - 1
+    children = []
+    for i in range(count):
+        share = max(1, remaining // (count - i))
+        remaining -= share
+        children.append(packet(rng, share, depth + 1))
+    body = ''.join(children)
+
+    if len(body) < 1 << 15 and rng.random() < 0.5:
+        return f'{version:03b}{type_id:03b}0{len(body):015b}' + body
+    return f'{version:03b}{type_id:03b}1{count:011b}' + body
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    bits = packet(rng, size, 0)
+    bits += '0' * (-len(bits) % 4)
+    return ''.join(f'{int(bits[i:i+4], 2):X}' for i in range(0, len(bits), 4)) + '\n'
@@ -0,0 +1,14 @@
+'''Day 17: a random target area (below and in front of the probe). The
+solution searches a fixed range of velocities, so there is no size.'''
+
+import random
+
+SIZES = None
+
+def generate(size=None, seed=0):
+    rng = random.Random(seed)
+    x1 = rng.randint(20, 250)
+    x2 = x1 + rng.randint(10, 50)
+    y2 = -rng.randint(5, 150)
+    y1 = y2 - rng.randint(5, 50)
+    return f'target area: x={x1}..{x2}, y={y1}..{y2}\n'
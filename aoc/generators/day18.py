@@ -0,0 +1,15 @@
+'''Day 18: size is the number of snailfish numbers (part 2 adds every
+ordered pair).'''
+
+import random
+
+SIZES = (25, 50, 100, 200)
+
+def number(rng, depth=0):
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randint(0, 9))
+    return f'[{number(rng, depth + 1)},{number(rng, depth + 1)}]'
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return ''.join(number(rng) + '\n' for _ in range(size))
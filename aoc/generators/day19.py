@@ -0,0 +1,63 @@
+'''Day 19: size is the number of scanners.
+
+The scanners are placed along a random chain, where each scanner overlaps the
+previous one and they have at least 12 beacons in common. Each scanner reports
+the beacons within 1000 units, in one of the 24 orientations.'''
+
+import itertools
+import random
+
+SIZES = (4, 8, 16, 32)
+
+RANGE = 1000
+
+def rotations():
+    '''The 24 proper rotations, as (axis permutation, signs).'''
+    result = []
+    for perm in itertools.permutations(range(3)):
+        # the parity of the permutation decides the sign of the determinant
+        inversions = sum(perm[i] > perm[j] for i in range(3) for j in range(i + 1, 3))
+        for signs in itertools.product([1, -1], repeat=3):
+            if (-1) ** inversions * signs[0] * signs[1] * signs[2] == 1:
+                result.append((perm, signs))
+    return result
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    point = lambda low, high: tuple(rng.randint(l, h) for l, h in zip(low, high))
+
+    positions = [(0, 0, 0)]
+    beacons = set()
+    for i in range(size):
+        p = positions[-1]
+        low = [c - RANGE for c in p]
+        high = [c + RANGE for c in p]
+        if i > 0:
+            # plant common beacons where this scanner overlaps the previous
+            q = positions[-2]
+            low = [max(a, b - RANGE) for a, b in zip(low, q)]
+            high = [min(a, b + RANGE) for a, b in zip(high, q)]
+            common = set()
+            while len(common) < 12:
+                common.add(point(low, high))
+            beacons |= common
+        # and some beacons of its own
+        own = [c - RANGE for c in p], [c + RANGE for c in p]
+        for _ in range(14):
+            beacons.add(point(*own))
+        # the next scanner
+        positions.append(tuple(c + rng.randint(-1100, 1100) for c in p))
+    positions.pop()
+
+    out = []
+    all_rotations = rotations()
+    for n, p in enumerate(positions):
+        perm, signs = rng.choice(all_rotations)
+        out.append(f'--- scanner {n} ---')
+        seen = [b for b in beacons if all(abs(c - d) <= RANGE for c, d in zip(b, p))]
+        rng.shuffle(seen)
+        for b in seen:
+            rel = [c - d for c, d in zip(b, p)]
+            out.append(','.join(str(rel[perm[k]] * signs[k]) for k in range(3)))
+        out.append('')
+    return '\n'.join(out)
@@ -0,0 +1,16 @@
+'''Day 20: size is the side of the square input image. The enhancement
+program never turns on infinitely many pixels for good (program[0] and
+program[511] are not both '#').'''
+
+import random
+
+SIZES = (25, 50, 100, 200)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    program = [rng.choice('.#') for _ in range(512)]
+    if program[0] == '#':
+        program[511] = '.'
+    out = [''.join(program), '']
+    out.extend(''.join(rng.choice('.#') for _ in range(size)) for _ in range(size))
+    return '\n'.join(out) + '\n'
@@ -0,0 +1,9 @@
+'''Day 21: random starting positions; there is no size.'''
+
+import random
+
+SIZES = None
+
+def generate(size=None, seed=0):
+    rng = random.Random(seed)
+    return ''.join(f'Player {p} starting position: {rng.randint(1, 10)}\n' for p in (1, 2))
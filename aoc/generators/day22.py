@@ -0,0 +1,23 @@
+'''Day 22: size is the number of reboot steps. As in the puzzle, the first
+steps (up to 20) lie within the -50..50 region, and the rest are large.'''
+
+import random
+
+SIZES = (10, 20, 40, 80)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(size):
+        if i < min(20, (size + 1) // 2):
+            extent, length = 50, 50
+        else:
+            extent, length = 100000, 50000
+        ranges = []
+        for axis in 'xyz':
+            low = rng.randint(-extent, extent - length)
+            ranges.append(f'{axis}={low}..{low + rng.randint(1, length)}')
+        # the first step turns cubes on (otherwise it does nothing)
+        cmd = 'on' if i == 0 or rng.random() < 0.6 else 'off'
+        out.append(f'{cmd} ' + ','.join(ranges) + '\n')
+    return ''.join(out)
@@ -0,0 +1,15 @@
+'''Day 23: a random arrangement of the amphipods in the side rooms; there is
+no size.'''
+
+import random
+
+SIZES = None
+
+def generate(size=None, seed=0):
+    rng = random.Random(seed)
+    a = rng.sample('AABBCCDD', 8)
+    return ('#############\n'
+            '#...........#\n'
+            f'###{a[0]}#{a[1]}#{a[2]}#{a[3]}###\n'
+            f'  #{a[4]}#{a[5]}#{a[6]}#{a[7]}#\n'
+            '  #########\n')
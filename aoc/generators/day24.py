@@ -0,0 +1,52 @@
+'''Day 24: size is the number of digits of the model number (an even number;
+the puzzle has 14). The program has the same structure as the puzzle's: each
+digit either pushes onto a base-26 stack kept in z, or pops it and requires
+the digit to equal the pushed digit plus an offset. The pushes and pops are
+paired randomly, and the offsets are chosen so every pair can be satisfied.'''
+
+import random
+
+SIZES = (2, 4, 6, 8)
+
+BLOCK = '''inp w
+mul x 0
+add x z
+mod x 26
+div z {div}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y
+'''
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    size += size % 2
+
+    # a random balanced sequence of pushes and pops
+    pushes_left = pops_left = size // 2
+    stack = []
+    out = []
+    while pushes_left or pops_left:
+        if pushes_left and (not stack or rng.random() < 0.5):
+            pushes_left -= 1
+            offset = rng.randint(1, 16)
+            stack.append(offset)
+            # check >= 10 means the digit never matches, so this always pushes
+            out.append(BLOCK.format(div=1, check=rng.randint(10, 16), offset=offset))
+        else:
+            pops_left -= 1
+            # the popped digit must equal the pushed digit + offset + check
+            delta = rng.randint(-8, 8)
+            check = delta - stack.pop()
+            out.append(BLOCK.format(div=26, check=check, offset=rng.randint(1, 16)))
+    return ''.join(out)
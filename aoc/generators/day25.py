@@ -0,0 +1,18 @@
+'''Day 25: size is the side of the square map of sea cucumbers.
+
+To make sure the herds eventually stop, one row is all east-facing and one
+column is all south-facing (apart from the cell they share). Neither can ever
+move, and no other sea cucumber can get past them.'''
+
+import random
+
+SIZES = (25, 50, 100, 200)
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    grid = [rng.choices('.>v', weights=[2, 1, 1], k=size) for _ in range(size)]
+    wall_row, wall_col = rng.randrange(size), rng.randrange(size)
+    for i in range(size):
+        grid[i][wall_col] = 'v'
+    grid[wall_row] = ['>'] * size
+    return ''.join(''.join(row) + '\n' for row in grid)
@@ -0,0 +1,104 @@
+'''A two-dimensional grid of small integers, stored row by row in one flat
+array('b'), so that a cell is a single integer index rather than an (i, j)
+tuple.
+
+A grid may be padded with a ring of border cells around it, holding a given
+value (e.g. 9 for the basin walls of day 9). With a padding of at least one,
+every neighbour of an interior cell is a valid index, so searches can visit
+neighbours without bounds checks: the border value is what stops them. The
+index offsets of the 4 and 8 neighbours of a cell are in offsets4 and offsets8.
+'''
+
+from array import array
+
+# translation table from the characters '0' to '9' to the values 0 to 9
+DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+class Grid:
+    def __init__(self, rows, cols, pad=0, border=0):
+        '''A grid of rows x cols cells, all 0, surrounded by pad rings of
+        border cells.'''
+        self.rows = rows
+        self.cols = cols
+        self.pad = pad
+        self.border = border
+        self.stride = cols + 2 * pad
+        self.cells = array('b', [border]) * ((rows + 2 * pad) * self.stride)
+        if border:
+            zeros = array('b', bytes(cols))
+            for r in range(rows):
+                start = self.index(r, 0)
+                self.cells[start:start + cols] = zeros
+
+        s = self.stride
+        self.offsets4 = (-s, -1, 1, s)
+        self.offsets8 = (-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1)
+
+    @classmethod
+    def from_lines(cls, lines, pad=0, border=0, table=DIGITS):
+        '''Parse a grid from lines of characters, all of the same length.
+        Characters are translated to values by the given table (see
+        bytes.maketrans); by default, digits become their values.'''
+        lines = [line.strip() for line in lines]
+        lines = [line for line in lines if line]
+        grid = cls(len(lines), len(lines[0]) if lines else 0, pad, border)
+        for r, line in enumerate(lines):
+            assert len(line) == grid.cols, (r, len(line), grid.cols)
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.cols] = array('b', line.encode().translate(table))
+        return grid
+
+    @classmethod
+    def from_rows(cls, rows, pad=0, border=0):
+        '''Build a grid from a list of rows, each a sequence of values.'''
+        grid = cls(len(rows), len(rows[0]) if rows else 0, pad, border)
+        for r, row in enumerate(rows):
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.cols] = array('b', row)
+        return grid
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = array('b', self.cells)
+        return grid
+
+    def index(self, r, c):
+        '''The index of the cell at row r, column c (which may be in the
+        padding, e.g. r = -1).'''
+        return (r + self.pad) * self.stride + c + self.pad
+
+    def coords(self, i):
+        '''The (row, column) of the cell with index i.'''
+        r, c = divmod(i, self.stride)
+        return r - self.pad, c - self.pad
+
+    def row(self, r):
+        '''The values of row r (without the padding).'''
+        start = self.index(r, 0)
+        return self.cells[start:start + self.cols]
+
+    def interior(self):
+        '''Iterate over the indices of the cells that are not padding, row by
+        row.'''
+        for r in range(self.rows):
+            start = self.index(r, 0)
+            yield from range(start, start + self.cols)
+
+    def count(self, value):
+        '''The number of cells (not counting the padding) that hold value.'''
+        if not self.pad:
+            return self.cells.count(value)
+        return sum(self.row(r).count(value) for r in range(self.rows))
+
+    def __getitem__(self, i):
+        return self.cells[i]
+
+    def __setitem__(self, i, value):
+        self.cells[i] = value
+
+    def __len__(self):
+        return self.rows * self.cols
+
+    def __str__(self):
+        return '\n'.join(''.join(map(str, self.row(r))) for r in range(self.rows))
@@ -0,0 +1,83 @@
+'''Measure how long it takes to import each day's script.
+
+Each script (including alternatives such as 23/23_dijkstra.py) is imported in a
+fresh interpreter under "python -X importtime", and the cumulative import time
+of the script's module (including everything it imports) is taken from that
+report; the best of a few runs is kept. A script fails the check if its import
+takes longer than the budget, or if it prints anything while being imported.
+
+    python3 -m aoc.importtime
+    python3 -m aoc.importtime 8 22-23 --budget 0.02 --repeat 5
+'''
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+
+from aoc import days
+
+def scripts(day):
+    '''The scripts of the day: e.g. 23/23.py and 23/23_dijkstra.py.'''
+    return sorted(glob.glob(os.path.join(days.day_dir(day), f'{day}*.py')))
+
+def parse_importtime(report):
+    '''Parse the stderr of "python -X importtime" into {module: (self us,
+    cumulative us)}.'''
+    times = {}
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header
+        self_us, cumulative_us, name = fields
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def import_time(script):
+    '''Import the script in a new interpreter. Return (seconds, what it printed
+    to stdout).'''
+    module = os.path.basename(script)[:-len('.py')]
+    # __import__ (unlike importlib.import_module) is timed by -X importtime
+    code = f'__import__({module!r})'
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=os.path.dirname(script), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f'importing {script} failed:\n{proc.stderr}')
+    _, cumulative_us = parse_importtime(proc.stderr)[module]
+    return cumulative_us / 1e6, proc.stdout
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('days', nargs='*', help='days to check, e.g. 15 or 19-22 (default: all)')
+    parser.add_argument('--budget', type=float, default=0.05,
+            help='maximum import time of a script (seconds)')
+    parser.add_argument('--repeat', type=int, default=3, help='imports per script (best is kept)')
+    args = parser.parse_args()
+
+    failures = 0
+    for day in days.parse_days(args.days):
+        for script in scripts(day):
+            runs = [import_time(script) for _ in range(args.repeat)]
+            seconds = min(t for t, _ in runs)
+            output = runs[0][1]
+
+            problems = []
+            if seconds > args.budget:
+                problems.append(f'over budget ({args.budget:.3f}s)')
+            if output:
+                problems.append(f'prints {len(output.splitlines())} lines on import')
+            failures += bool(problems)
+
+            name = os.path.relpath(script, days.ROOT)
+            status = 'FAIL: ' + ', '.join(problems) if problems else 'ok'
+            print(f'{name:20} {seconds:8.4f}s  {status}', flush=True)
+
+    if failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
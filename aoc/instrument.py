@@ -0,0 +1,109 @@
+'''Opt-in counters and timers for the hot paths of the solutions.
+
+Set AOC_INSTRUMENT=1 in the environment to turn instrumentation on. Then:
+    @instrument.timed()           counts the calls and time of a function
+    with instrument.section(name) times a block of code
+    instrument.count(name, n)     adds n to a counter (e.g. nodes expanded)
+and a report, sorted by total time, is printed to stderr when the program
+exits.
+
+When instrumentation is off, timed() returns the function unchanged and
+section() and count() do nothing, so instrumented code costs nothing (or one
+function call, for counters; the hottest loops can guard with
+"if instrument.ENABLED").'''
+
+import atexit
+import collections
+import contextlib
+import functools
+import os
+import sys
+import time
+
+ENABLED = bool(os.environ.get('AOC_INSTRUMENT'))
+
+# flag set on the code of generator functions
+CO_GENERATOR = 0x20
+
+class Stat:
+    def __init__(self):
+        self.calls = 0
+        self.count = 0
+        self.seconds = 0.0
+        # how many calls are currently active; only the outermost of a
+        # recursive function is timed, so time is not counted twice
+        self.depth = 0
+
+STATS = collections.defaultdict(Stat)
+
+def count(name, n=1):
+    '''Add n to the named counter.'''
+    if ENABLED:
+        STATS[name].count += n
+
+def timed(name=None):
+    '''Decorator that counts calls to the function and the time spent in it. For
+    a generator function, the time spent producing its values is counted.'''
+    def decorator(f):
+        if not ENABLED:
+            return f
+        stat = STATS[name or f.__qualname__]
+
+        if f.__code__.co_flags & CO_GENERATOR:
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                stat.calls += 1
+                it = f(*args, **kwargs)
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        value = next(it)
+                    except StopIteration:
+                        return
+                    finally:
+                        stat.seconds += time.perf_counter() - start
+                    yield value
+            return wrapper
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            stat.calls += 1
+            stat.depth += 1
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                stat.depth -= 1
+                if not stat.depth:
+                    stat.seconds += time.perf_counter() - start
+        return wrapper
+    return decorator
+
+@contextlib.contextmanager
+def _section(name):
+    stat = STATS[name]
+    stat.calls += 1
+    start = time.perf_counter()
+    try:
+        yield stat
+    finally:
+        stat.seconds += time.perf_counter() - start
+
+def section(name):
+    '''Context manager that times a block of code.'''
+    return _section(name) if ENABLED else contextlib.nullcontext()
+
+def report(file=None):
+    '''Print the statistics, most time-consuming first.'''
+    file = file or sys.stderr
+    stats = {name: s for name, s in STATS.items() if s.calls or s.count}
+    if not stats:
+        return
+    print(f'{"":40} {"calls":>12} {"count":>14} {"seconds":>12} {"us/call":>10}', file=file)
+    order = sorted(stats.items(), key=lambda kv: (kv[1].seconds, kv[1].count), reverse=True)
+    for name, s in order:
+        per_call = f'{s.seconds / s.calls * 1e6:10.2f}' if s.calls else f'{"":10}'
+        print(f'{name:40} {s.calls:12} {s.count:14} {s.seconds:12.6f} {per_call}', file=file)
+
+if ENABLED:
+    atexit.register(report)
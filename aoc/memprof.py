@@ -0,0 +1,173 @@
+'''Profile the memory used by the daily solutions.
+
+Each part is run under tracemalloc, which reports the peak memory allocated by
+the part (the parsed input is not counted), and the top allocation sites. The
+sites come from snapshots taken by a background thread whenever the traced
+memory has grown by 10% since the last one, so they show (close to) what was
+live at the peak, rather than what is left when the part returns.
+
+Peaks are compared against baselines stored on disk (AOC_MEMPROF_BASELINE, by
+default memprof.json at the top of the repository), keyed by day and part, and
+a peak that grew by more than the threshold is reported as a regression.
+
+    ./22.py --memprof                       # profile one day
+    ./22.py --memprof-update                # ... and record its baselines
+    python3 -m aoc.memprof 15 21-22 --top 10
+    python3 -m aoc.memprof --update         # record the baselines of every day
+'''
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import tracemalloc
+
+from aoc import days
+from aoc.days import ROOT
+
+BASELINE_FILE = os.environ.get('AOC_MEMPROF_BASELINE', os.path.join(ROOT, 'memprof.json'))
+
+# growth (fraction) of the traced memory that triggers a new snapshot
+SNAPSHOT_GROWTH = 0.1
+# seconds between checks of the traced memory
+POLL_INTERVAL = 0.01
+# peaks that grow by less than this many bytes are never regressions, so that
+# small parts are not flagged for noise
+SLACK = 1 << 16
+
+def format_bytes(n):
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(n) < 1024:
+            return f'{n:.1f} {unit}' if unit != 'B' else f'{n} B'
+        n /= 1024
+    return f'{n:.1f} GiB'
+
+class _Snapshotter(threading.Thread):
+    '''Take a snapshot whenever the traced memory grows enough; keep the
+    largest.'''
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stop = threading.Event()
+        self.size = 0
+        self.snapshot = None
+
+    def take(self):
+        size, _ = tracemalloc.get_traced_memory()
+        if size > self.size * (1 + SNAPSHOT_GROWTH):
+            self.size, self.snapshot = size, tracemalloc.take_snapshot()
+
+    def run(self):
+        while not self.stop.wait(POLL_INTERVAL):
+            self.take()
+
+def profile(f, args, top=5):
+    '''Call f(*args) under tracemalloc. Return (answer, peak bytes, sites),
+    where sites lists the top (place, bytes, blocks) allocation sites.'''
+    tracemalloc.start()
+    snapshotter = _Snapshotter()
+    snapshotter.start()
+    try:
+        answer = f(*args)
+    finally:
+        snapshotter.stop.set()
+        snapshotter.join()
+        # the part may have been quicker than the polling
+        snapshotter.take()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    snapshot = snapshotter.snapshot
+    sites = []
+    if snapshot:
+        snapshot = snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, '*/_weakrefset.py'),
+                tracemalloc.Filter(False, __file__),
+                ])
+        for stat in snapshot.statistics('lineno')[:top]:
+            frame = stat.traceback[0]
+            place = f'{os.path.relpath(frame.filename, ROOT)}:{frame.lineno}'
+            sites.append((place, stat.size, stat.count))
+    return answer, peak, sites
+
+def load_baselines(path=None):
+    try:
+        with open(path or BASELINE_FILE) as f:
+            return json.load(f)['days']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+def save_baselines(results, path=None):
+    '''Merge {name: {'part1': {'peak': bytes}, ...}} into the baselines.'''
+    baselines = load_baselines(path)
+    for name, parts in results.items():
+        baselines.setdefault(name, {}).update(parts)
+    with open(path or BASELINE_FILE, 'w') as f:
+        json.dump({'days': dict(sorted(baselines.items()))}, f, indent=2)
+
+def is_regression(peak, old, threshold):
+    return old is not None and peak > old * (1 + threshold) and peak - old > SLACK
+
+def report(name, part, peak, sites, baselines, threshold):
+    '''Print the peak and top sites of a part, and compare the peak with its
+    baseline. Return True if it is a regression.'''
+    old = baselines.get(name, {}).get(f'part{part}', {}).get('peak')
+    against = f' (baseline {format_bytes(old)})' if old is not None else ''
+    print(f'  part {part} peak memory: {format_bytes(peak)}{against}')
+    for place, size, count in sites:
+        print(f'    {format_bytes(size):>12} in {count:8} blocks  {place}')
+    regression = is_regression(peak, old, threshold)
+    if regression:
+        print(f'REGRESSION {name} part{part}: peak {format_bytes(old)} -> {format_bytes(peak)}')
+    return regression
+
+def run_part(script, n, part, args, top=5, threshold=0.2):
+    '''Profile part n of a day's script and report it (for aoc.run when
+    --memprof or --memprof-update is given). Return the answer.'''
+    name = os.path.basename(script)[:-len('.py')]
+    answer, peak, sites = profile(part, args, top)
+    report(name, n, peak, sites, load_baselines(), threshold)
+    if '--memprof-update' in sys.argv:
+        save_baselines({name: {f'part{n}': {'peak': peak}}})
+    return answer
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 15 or 19-22 (default: all)')
+    parser.add_argument('--top', type=int, default=5, help='allocation sites to show per part')
+    parser.add_argument('--input', help='input file name within each day directory')
+    parser.add_argument('--baseline', help=f'baseline JSON file (default: {BASELINE_FILE})')
+    parser.add_argument('--update', action='store_true', help='record the peaks as the baselines')
+    parser.add_argument('--threshold', type=float, default=0.2,
+            help='growth fraction of the peak that counts as a regression')
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baseline)
+    results = {}
+    regressions = 0
+    for day in days.parse_days(args.days):
+        module = days.load_module(day)
+        file = days.input_path(day, args.input)
+        print(f'day {day:2}:', flush=True)
+        results[str(day)] = {}
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            part_args = days.read_args(module, file)
+        for part, f in days.parts(module):
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                _, peak, sites = profile(f, part_args, args.top)
+            results[str(day)][f'part{part}'] = {'peak': peak}
+            regressions += report(str(day), part, peak, sites, baselines, args.threshold)
+            sys.stdout.flush()
+
+    if args.update:
+        save_baselines(results, args.baseline)
+    if regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
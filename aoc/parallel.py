@@ -0,0 +1,56 @@
+'''Process a file in chunks, in a pool of processes.
+
+map_lines() splits a (memory-mapped) file into chunks that end on line
+boundaries, and calls a function on the bytes of each chunk in a pool of
+processes. Days use this for inputs too large to parse in one go (e.g. 01/1.py
+and 02/2.py with --parallel).
+
+The function is passed to the workers as its script's path and its name, and
+each worker imports the script by path. So it works for a script run as
+__main__ as well as for one imported with aoc.days.load_module(), which pickle
+cannot find by name.'''
+
+import concurrent.futures
+import importlib.util
+import mmap
+import os
+
+from aoc import numeric
+
+# bytes per chunk of the file
+CHUNK_BYTES = 1 << 24
+
+# the scripts imported by this (worker) process, by path
+_scripts = {}
+
+def _function(path, name):
+    if path not in _scripts:
+        module_name = 'chunk_' + os.path.basename(path)[:-len('.py')]
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scripts[path] = module
+    return getattr(_scripts[path], name)
+
+def _call(path, name, file, low, high, args):
+    with open(file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        data = m[low:high]
+    return _function(path, name)(data, *args)
+
+def map_lines(f, file, *args, workers=None, chunk_bytes=None):
+    '''Return the list of f(data, *args) for the chunks of the file in order,
+    where data is the bytes of a chunk of about chunk_bytes (by default
+    CHUNK_BYTES) bytes that ends with a newline (or the end of the file). f
+    must be a top-level function of a script.'''
+    with open(file, 'rb') as fp:
+        if not os.fstat(fp.fileno()).st_size:
+            # an empty file cannot be mapped
+            return []
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            bounds = list(numeric.line_bounds(m, chunk_bytes or CHUNK_BYTES))
+
+    path = os.path.abspath(f.__globals__['__file__'])
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_call, path, f.__name__, file, low, high, args)
+                   for low, high in bounds]
+        return [future.result() for future in futures]
@@ -0,0 +1,115 @@
+'''Run every day's solutions concurrently in a pool of processes.
+
+Each (day, part) is a separate job. Jobs are started longest-first (using the
+medians from a benchmark JSON file, if given, or else rough built-in estimates),
+so that the slow days start right away and the quick ones fill in around them.
+The answers are printed in calendar order, as soon as each is available. Each
+job is stopped if it runs longer than the timeout.
+
+    python3 -m aoc.runall
+    python3 -m aoc.runall 1-10 --workers 4 --timeout 60 --history bench.json
+'''
+
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import os
+import signal
+import time
+
+from aoc import days
+
+# rough running times (seconds) of the slow parts; everything else is assumed
+# to take about a second or less
+EXPECTED_SECONDS = {
+        (17, 1): 5, (17, 2): 5,
+        (19, 1): 10, (19, 2): 10,
+        (22, 2): 300,
+        (23, 1): 300, (23, 2): 1200,
+        (24, 1): 60, (24, 2): 3600,
+        (25, 1): 3,
+        }
+
+class JobTimeout(Exception):
+    pass
+
+def _alarm(signum, frame):
+    raise JobTimeout()
+
+def run_job(day, part, file, timeout):
+    '''Run one part of one day (in a worker process). Return (status, answer,
+    seconds), where status is 'ok', 'timeout' or 'error'.'''
+    start = time.perf_counter()
+    old_handler = signal.signal(signal.SIGALRM, _alarm)
+    if timeout:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            module = days.load_module(day)
+            answer = getattr(module, f'part{part}')(*days.read_args(module, file))
+        status = 'ok'
+    except JobTimeout:
+        status, answer = 'timeout', None
+    except Exception as e:
+        status, answer = 'error', f'{type(e).__name__}: {e}'
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old_handler)
+    return status, answer, time.perf_counter() - start
+
+def expected_seconds(history):
+    '''Expected running time of each (day, part), from a benchmark JSON file if
+    given (see aoc.bench), falling back to the built-in estimates. Each job
+    parses its input, so the time of parsing (the "parse" entry) is added to
+    the time of each part; other entries are ignored.'''
+    expected = dict(EXPECTED_SECONDS)
+    if history:
+        with open(history) as f:
+            for day, parts in json.load(f)['days'].items():
+                parse = parts.get('parse', {}).get('median', 0)
+                for part, stats in parts.items():
+                    if part.startswith('part') and part[len('part'):].isdigit():
+                        expected[(int(day), int(part[len('part'):]))] = stats['median'] + parse
+    return expected
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 15 or 19-22 (default: all)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+            help='number of worker processes')
+    parser.add_argument('--timeout', type=float, default=0,
+            help='stop any job that runs longer than this many seconds (default: none)')
+    parser.add_argument('--history', help='benchmark JSON file with the expected running times')
+    parser.add_argument('--input', help='input file name within each day directory')
+    args = parser.parse_args()
+
+    expected = expected_seconds(args.history)
+    jobs = []
+    for day in days.parse_days(args.days):
+        for part, _ in days.parts(days.load_module(day)):
+            jobs.append((day, part, days.input_path(day, args.input)))
+
+    # longest job first; the executor starts jobs in the order they are
+    # submitted
+    jobs.sort(key=lambda job: expected.get(job[:2], 1), reverse=True)
+
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {(day, part): executor.submit(run_job, day, part, file, args.timeout)
+                   for day, part, file in jobs}
+
+        busy = 0
+        for day, part in sorted(futures):
+            status, answer, seconds = futures[(day, part)].result()
+            busy += seconds
+            if status != 'ok':
+                answer = status.upper() + (f' ({answer})' if answer else '')
+            print(f'day {day:2} part {part}: {answer}   [{seconds:.3f}s]', flush=True)
+
+    wall = time.perf_counter() - start
+    print(f'wall time {wall:.3f}s; total job time {busy:.3f}s')
+
+if __name__ == '__main__':
+    main()
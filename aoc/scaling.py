@@ -0,0 +1,119 @@
+'''Measure how the solutions scale with the size of their input.
+
+For each day, synthetic inputs of increasing size are generated (see
+aoc.generators), and the parsing of each (read_input, reported as "parse",
+since e.g. day 19 merges its scanners there) and each part are timed on each of
+them. Every timed call is preceded by an untimed warmup, so that one-time costs
+such as lazy imports are not counted, and each call of a part gets a fresh copy
+of the parsed input. The empirical complexity exponent k (time ~ size^k) is the
+slope of the least-squares line through the (log size, log time) points.
+
+    python3 -m aoc.scaling 15 19
+    python3 -m aoc.scaling 1 --sizes 100000 1000000 10000000 --repeat 1
+'''
+
+import argparse
+import contextlib
+import copy
+import json
+import math
+import os
+import tempfile
+import time
+
+from aoc import days
+from aoc import generators
+
+def fit_exponent(sizes, times):
+    '''Return the slope of the least-squares fit of log(time) vs. log(size), or
+    None if there are not enough (non-zero) points to fit.'''
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if s > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+def best_time(f, make_args, repeat):
+    '''The minimum wall time of repeat calls to f(*make_args()), after one
+    untimed warmup call. Return (result, time). The arguments are made afresh
+    for every call, outside of the timing.'''
+    f(*make_args())
+    best = result = None
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        result = f(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def scale_day(day, sizes, repeat, budget, seed):
+    '''Time the parsing and each part of the day at each size. Once one of
+    them takes longer than the budget (seconds), larger sizes are skipped for
+    it (and for the parts, once parsing does). Return {'parse': {'sizes': [...],
+    'times': [...], 'exponent': k}, 'part1': {...}, ...}.'''
+    module = days.load_module(day)
+    results = {'parse': {'sizes': [], 'times': []}}
+    results.update({f'part{p}': {'sizes': [], 'times': []} for p, _ in days.parts(module)})
+    within_budget = lambda name: not results[name]['times'] or results[name]['times'][-1] < budget
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            if not within_budget('parse'):
+                break
+            live = [(p, f) for p, f in days.parts(module) if within_budget(f'part{p}')]
+            if not live:
+                break
+
+            file = os.path.join(tmp, f'{day}_{size}.in')
+            generators.write(day, size, file, seed)
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                args, seconds = best_time(days.read_args, lambda: (module, file), repeat)
+                results['parse']['sizes'].append(size)
+                results['parse']['times'].append(seconds)
+                for p, f in live:
+                    r = results[f'part{p}']
+                    r['sizes'].append(size)
+                    r['times'].append(best_time(f, lambda: copy.deepcopy(args), repeat)[1])
+
+    for r in results.values():
+        r['exponent'] = fit_exponent(r['sizes'], r['times'])
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 15 or 19-22 (default: all)')
+    parser.add_argument('--sizes', type=int, nargs='+',
+            help="input sizes (default: each generator's SIZES)")
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per size (best is kept)')
+    parser.add_argument('--budget', type=float, default=60,
+            help='stop growing a part once a run takes this many seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    results = {}
+    for day in days.parse_days(args.days):
+        sizes = args.sizes or generators.generator(day).SIZES
+        if not sizes:
+            print(f'day {day:2}: input has no size; skipped')
+            continue
+
+        results[str(day)] = scale_day(day, sizes, args.repeat, args.budget, args.seed)
+        for part, r in results[str(day)].items():
+            k = r['exponent']
+            times = '  '.join(f'{s}:{t:.4f}' for s, t in zip(r['sizes'], r['times']))
+            exponent = f'{k:5.2f}' if k is not None else '    ?'
+            print(f'day {day:2} {part}: exponent {exponent}   {times}', flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
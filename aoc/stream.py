@@ -0,0 +1,73 @@
+'''Feed one stream of input to several parts at once.
+
+A stream (e.g. stdin) can only be read once, but each part wants to see all of
+it. fan_out() reads the stream in the calling thread, in chunks, and hands each
+chunk to every part, each of which runs in its own thread and sees an ordinary
+iterator over the items. The queues between them are bounded, so only a few
+chunks are in memory at a time (unless a part keeps the items itself).'''
+
+import queue
+import threading
+
+# end of stream marker
+_END = object()
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def fan_out(items, *consumers, chunk=1024, depth=16):
+    '''Call each consumer with an iterator over the same items, reading the items
+    only once. Return the list of what the consumers return; if any consumer
+    raises an exception, it is raised here.'''
+    if len(consumers) == 1:
+        return [consumers[0](items)]
+
+    queues = [queue.Queue(maxsize=depth) for _ in consumers]
+    results = [None] * len(consumers)
+    errors = [None] * len(consumers)
+
+    def run(i, consumer):
+        q = queues[i]
+        done = False
+        def queued_items():
+            nonlocal done
+            for c in iter(q.get, _END):
+                yield from c
+            done = True
+
+        try:
+            results[i] = consumer(queued_items())
+        except BaseException as e:
+            errors[i] = e
+        # a consumer may stop early; keep draining, so the reader never blocks
+        # on a full queue
+        if not done:
+            for _ in iter(q.get, _END):
+                pass
+
+    threads = [threading.Thread(target=run, args=(i, c), daemon=True)
+               for i, c in enumerate(consumers)]
+    for t in threads:
+        t.start()
+
+    try:
+        for c in _chunks(items, chunk):
+            for q in queues:
+                q.put(c)
+    finally:
+        for q in queues:
+            q.put(_END)
+        for t in threads:
+            t.join()
+
+    for e in errors:
+        if e is not None:
+            raise e
+    return results